@@ -1,7 +1,6 @@
 """ Use `pyg` to draw a complex 3D scene.
 """
 
-import time
 from timeit import default_timer as timer
 
 import pyg
@@ -9,21 +8,26 @@ import pyg
 CAMERA_MOV_SPEED = 1
 MOUSE_SENSITIVITY = 0.2
 SCROLL_SENSITIVITY = 2
-DOG_SPEED = 500
+DOG_SPEED = 1.5
 
+# Directions in which the camera moves when each key is pressed.
+KEY_DIRECTIONS = {
+    pyg.Key.W: "forward",
+    pyg.Key.S: "backward",
+    pyg.Key.A: "left",
+    pyg.Key.D: "right",
+}
 
-def make_tree(x: float,
+
+def make_tree(trees: pyg.objects.InstancedTexturizedGraphicObject,
+              x: float,
               y: float,
-              z: float) -> pyg.objects.TexturizedGraphicObject:
-    t = pyg.objects.TexturizedGraphicObject.from_file(
-        file_path="objects/tree/tree.obj",
-        texture_img_path="objects/tree/tree.jpg",
-        primitive=pyg.PrimitiveShape.TRIANGLE_STRIP,
-    )
-    t.transform.rotate(-90, axis="x")
-    t.transform.scale(sx=0.00175, sy=0.00175, sz=0.00175)
-    t.transform.translate(tx=x, ty=y, tz=z)
-    return t
+              z: float) -> None:
+    t = pyg.TransformationHandler()
+    t.rotate(-90, axis="x")
+    t.scale(sx=0.00175, sy=0.00175, sz=0.00175)
+    t.translate(tx=x, ty=y, tz=z)
+    trees.add_instance(t.matrix)
 
 
 if __name__ == "__main__":
@@ -33,14 +37,31 @@ if __name__ == "__main__":
     window.camera.movement_speed = CAMERA_MOV_SPEED
     window.camera.mouse_sensitivity = MOUSE_SENSITIVITY
     window.camera.move("backward", 1)
+    window.camera.set_bounds((-5, -0.5, -5), (5, 10, 5))
     window.show()
 
+    # Pack the textures of the objects into a single atlas. The textures of the
+    # terrains are repeated over their surfaces, so they can't be packed.
+    atlas = pyg.TextureAtlas([
+        "objects/house/house.png",
+        "objects/table/table.jpg",
+        "objects/chair/chair.png",
+        "objects/apple/apple.jpg",
+        "objects/bread/bread.png",
+        "objects/tree/tree.jpg",
+        "objects/dead_tree/dead_tree.jpg",
+        "objects/flower/flower.jpg",
+        "objects/dog/dog.jpg",
+        "objects/sun/sun.jpg",
+    ])
+
     objects = []
 
     # House.
     objects.append(pyg.objects.TexturizedGraphicObject.from_file(
         file_path="objects/house/house.obj",
         texture_img_path="objects/house/house.png",
+        atlas=atlas,
     ))
     objects[-1].transform.rotate(270, axis="y")
     objects[-1].transform.scale(sx=0.5, sy=0.5, sz=0.5)
@@ -50,6 +71,7 @@ if __name__ == "__main__":
     objects.append(pyg.objects.TexturizedGraphicObject.from_file(
         file_path="objects/table/table.obj",
         texture_img_path="objects/table/table.jpg",
+        atlas=atlas,
         primitive=pyg.PrimitiveShape.TRIANGLE_STRIP,
     ))
     objects[-1].transform.rotate(270, axis="x")
@@ -61,6 +83,7 @@ if __name__ == "__main__":
     objects.append(pyg.objects.TexturizedGraphicObject.from_file(
         file_path="objects/chair/chair.obj",
         texture_img_path="objects/chair/chair.png",
+        atlas=atlas,
         # primitive=pyg.PrimitiveShape.TRIANGLE_STRIP,
     ))
     objects[-1].transform.scale(sx=0.3, sy=0.3, sz=0.3)
@@ -70,6 +93,7 @@ if __name__ == "__main__":
     objects.append(pyg.objects.TexturizedGraphicObject.from_file(
         file_path="objects/apple/apple.obj",
         texture_img_path="objects/apple/apple.jpg",
+        atlas=atlas,
         primitive=pyg.PrimitiveShape.TRIANGLE_STRIP,
     ))
     objects[-1].transform.scale(sx=0.07, sy=0.07, sz=0.07)
@@ -79,6 +103,7 @@ if __name__ == "__main__":
     objects.append(pyg.objects.TexturizedGraphicObject.from_file(
         file_path="objects/bread/bread.obj",
         texture_img_path="objects/bread/bread.png",
+        atlas=atlas,
         primitive=pyg.PrimitiveShape.TRIANGLE_STRIP,
     ))
     objects[-1].transform.rotate(55, axis="y")
@@ -86,21 +111,29 @@ if __name__ == "__main__":
     objects[-1].transform.translate(tz=-3, tx=0.1, ty=-0.29)
 
     # Trees.
-    objects.append(make_tree(x=2, y=-0.65, z=0))
-    objects.append(make_tree(x=-2, y=-0.65, z=0))
-    objects.append(make_tree(x=-4, y=-0.65, z=-2))
-    objects.append(make_tree(x=4, y=-0.65, z=-2))
-    objects.append(make_tree(x=-3, y=-0.65, z=3.1))
-    objects.append(make_tree(x=4.57, y=-0.65, z=3))
-    objects.append(make_tree(x=3.25, y=-0.65, z=4))
-    objects.append(make_tree(x=-1.7, y=-0.65, z=4.25))
-    objects.append(make_tree(x=-1.9, y=-0.65, z=-4.25))
-    objects.append(make_tree(x=2.5, y=-0.65, z=-4))
+    trees = pyg.objects.InstancedTexturizedGraphicObject.from_file(
+        file_path="objects/tree/tree.obj",
+        texture_img_path="objects/tree/tree.jpg",
+        atlas=atlas,
+        primitive=pyg.PrimitiveShape.TRIANGLE_STRIP,
+    )
+    make_tree(trees, x=2, y=-0.65, z=0)
+    make_tree(trees, x=-2, y=-0.65, z=0)
+    make_tree(trees, x=-4, y=-0.65, z=-2)
+    make_tree(trees, x=4, y=-0.65, z=-2)
+    make_tree(trees, x=-3, y=-0.65, z=3.1)
+    make_tree(trees, x=4.57, y=-0.65, z=3)
+    make_tree(trees, x=3.25, y=-0.65, z=4)
+    make_tree(trees, x=-1.7, y=-0.65, z=4.25)
+    make_tree(trees, x=-1.9, y=-0.65, z=-4.25)
+    make_tree(trees, x=2.5, y=-0.65, z=-4)
+    objects.append(trees)
 
     # Dead trees.
     objects.append(pyg.objects.TexturizedGraphicObject.from_file(
         file_path="objects/dead_tree/dead_tree.obj",
         texture_img_path="objects/dead_tree/dead_tree.jpg",
+        atlas=atlas,
         primitive=pyg.PrimitiveShape.TRIANGLE_STRIP,
     ))
     objects[-1].transform.scale(sx=0.03, sy=0.03, sz=0.03)
@@ -109,62 +142,33 @@ if __name__ == "__main__":
     objects.append(pyg.objects.TexturizedGraphicObject.from_file(
         file_path="objects/dead_tree/dead_tree.obj",
         texture_img_path="objects/dead_tree/dead_tree.jpg",
+        atlas=atlas,
         primitive=pyg.PrimitiveShape.TRIANGLE_STRIP,
     ))
     objects[-1].transform.scale(sx=0.04, sy=0.04, sz=0.04)
     objects[-1].transform.translate(tx=-1.85, ty=-0.45, tz=1.4)
 
     # Flowers.
-    objects.append(pyg.objects.TexturizedGraphicObject.from_file(
-        file_path="objects/flower/flower.obj",
-        texture_img_path="objects/flower/flower.jpg",
-        primitive=pyg.PrimitiveShape.TRIANGLE_STRIP,
-    ))
-    objects[-1].transform.rotate(270, axis="x")
-    objects[-1].transform.scale(sx=0.0032, sy=0.0032, sz=0.0032)
-    objects[-1].transform.translate(tx=-0.05, ty=-0.56, tz=-1.32)
-
-    objects.append(pyg.objects.TexturizedGraphicObject.from_file(
-        file_path="objects/flower/flower.obj",
-        texture_img_path="objects/flower/flower.jpg",
-        primitive=pyg.PrimitiveShape.TRIANGLE_STRIP,
-    ))
-    objects[-1].transform.rotate(270, axis="x")
-    objects[-1].transform.scale(sx=0.0032, sy=0.0032, sz=0.0032)
-    objects[-1].transform.translate(tx=-0.25, ty=-0.56, tz=-1.32)
-
-    objects.append(pyg.objects.TexturizedGraphicObject.from_file(
-        file_path="objects/flower/flower.obj",
-        texture_img_path="objects/flower/flower.jpg",
-        primitive=pyg.PrimitiveShape.TRIANGLE_STRIP,
-    ))
-    objects[-1].transform.rotate(270, axis="x")
-    objects[-1].transform.scale(sx=0.0032, sy=0.0032, sz=0.0032)
-    objects[-1].transform.translate(tx=-0.45, ty=-0.56, tz=-1.32)
-
-    objects.append(pyg.objects.TexturizedGraphicObject.from_file(
+    flowers = pyg.objects.InstancedTexturizedGraphicObject.from_file(
         file_path="objects/flower/flower.obj",
         texture_img_path="objects/flower/flower.jpg",
+        atlas=atlas,
         primitive=pyg.PrimitiveShape.TRIANGLE_STRIP,
-    ))
-    objects[-1].transform.rotate(270, axis="x")
-    objects[-1].transform.scale(sx=0.0032, sy=0.0032, sz=0.0032)
-    objects[-1].transform.translate(tx=0.83, ty=-0.56, tz=-1.32)
-
-    objects.append(pyg.objects.TexturizedGraphicObject.from_file(
-        file_path="objects/flower/flower.obj",
-        texture_img_path="objects/flower/flower.jpg",
-        primitive=pyg.PrimitiveShape.TRIANGLE_STRIP,
-    ))
-    objects[-1].transform.rotate(270, axis="x")
-    objects[-1].transform.scale(sx=0.0032, sy=0.0032, sz=0.0032)
-    objects[-1].transform.translate(tx=1.03, ty=-0.56, tz=-1.32)
+    )
+    for flower_x in (-0.05, -0.25, -0.45, 0.83, 1.03):
+        t = pyg.TransformationHandler()
+        t.rotate(270, axis="x")
+        t.scale(sx=0.0032, sy=0.0032, sz=0.0032)
+        t.translate(tx=flower_x, ty=-0.56, tz=-1.32)
+        flowers.add_instance(t.matrix)
+    objects.append(flowers)
 
     # Dog.
     dog_z_pos = 0.0
     dog = pyg.objects.TexturizedGraphicObject.from_file(
         file_path="objects/dog/dog.obj",
         texture_img_path="objects/dog/dog.jpg",
+        atlas=atlas,
         primitive=pyg.PrimitiveShape.TRIANGLE_STRIP,
     )
     dog.transform.rotate(270, axis="x")
@@ -176,6 +180,7 @@ if __name__ == "__main__":
     objects.append(pyg.objects.TexturizedGraphicObject.from_file(
         file_path="objects/sun/sun.obj",
         texture_img_path="objects/sun/sun.jpg",
+        atlas=atlas,
         primitive=pyg.PrimitiveShape.TRIANGLE_STRIP,
     ))
     objects[-1].transform.scale(sx=0.0025, sy=0.0025, sz=0.0025)
@@ -190,23 +195,27 @@ if __name__ == "__main__":
     objects[-1].transform.scale(sx=6, sz=6)
 
     # Stone floor.
-    objects.append((pyg.objects.TexturizedGraphicObject.from_file(
+    stone_floor = pyg.objects.InstancedTexturizedGraphicObject.from_file(
         file_path="objects/terrain.obj",
         texture_img_path="objects/stone_floor.jpg",
-    )))
-    objects[-1].transform.translate(tz=-2.3, ty=-0.59)
-    objects[-1].transform.scale(sx=1.3, sz=1.3)
+    )
+    t = pyg.TransformationHandler()
+    t.translate(tz=-2.3, ty=-0.59)
+    t.scale(sx=1.3, sz=1.3)
+    stone_floor.add_instance(t.matrix)
     for i in range(16):
-        objects.append(pyg.objects.TexturizedGraphicObject.from_file(
-            file_path="objects/terrain.obj",
-            texture_img_path="objects/stone_floor.jpg",
-        ))
-        objects[-1].transform.translate(tx=1.7, tz=2 * i - 8, ty=-0.59)
-        objects[-1].transform.scale(sx=0.25, sz=0.25)
+        t = pyg.TransformationHandler()
+        t.translate(tx=1.7, tz=2 * i - 8, ty=-0.59)
+        t.scale(sx=0.25, sz=0.25)
+        stone_floor.add_instance(t.matrix)
+    objects.append(stone_floor)
 
     # Point in time in which the last frame was rendered.
     last_render = timer()
 
+    # Time elapsed between the last two frames, measured once per frame.
+    frame_dT = 0.0
+
     # Last recorded position of the mouse's cursor.
     last_cursor_pos = (None, None)
 
@@ -219,21 +228,11 @@ if __name__ == "__main__":
         if action not in (pyg.KeyboardAction.PRESS, pyg.KeyboardAction.REPEAT):
             return
 
-        try:
-            direction = {
-                pyg.Key.W: "forward",
-                pyg.Key.S: "backward",
-                pyg.Key.A: "left",
-                pyg.Key.D: "right",
-            }[key]
-            window.camera.move(direction, dT=timer() - last_render)
+        direction = KEY_DIRECTIONS.get(key)
+        if direction is None:
+            return
 
-            # Limit the camera's movement.
-            window.camera._pos[0] = max(min(window.camera._pos[0], 5), -5)
-            window.camera._pos[1] = max(min(window.camera._pos[1], 10), -0.5)
-            window.camera._pos[2] = max(min(window.camera._pos[2], 5), -5)
-        except KeyError:
-            pass
+        window.camera.move(direction, dT=frame_dT)
 
 
     # Callback to handle changes in the cursor's position.
@@ -262,6 +261,10 @@ if __name__ == "__main__":
 
     # Main loop.
     while not window.should_close():
+        frame_time = timer()
+        frame_dT = frame_time - last_render
+        last_render = frame_time
+
         # Clear the window.
         window.clear(color=(0.407, 0.612, 0.8, 1))
 
@@ -270,16 +273,14 @@ if __name__ == "__main__":
             DOG_SPEED *= -1
             dog_tz = max(min(dog_z_pos, 4.25), -0.25) - dog_z_pos
         else:
-            dog_tz = DOG_SPEED * (timer() - last_render)
+            dog_tz = DOG_SPEED * frame_dT
         dog_z_pos += dog_tz
         dog.transform.translate(tz=dog_tz)
 
-        # Draw the objects.
-        for obj in objects:
-            window.draw(obj)
+        # Draw the objects that are within the camera's view. The static
+        # objects are merged into batches the first time they are drawn.
+        window.draw_batch(objects, dynamic=[dog])
 
         # Poll for events and update the window.
         window.poll_events()
         window.update()
-        time.sleep(1 / 30)
-        last_render = timer()
@@ -1,45 +1,62 @@
 """ Draw simple shapes on a window using `pyg`.
 """
 
+from timeit import default_timer as timer
+
 import pyg
-import time
+
+
+def draw_scene(window: pyg.Window) -> None:
+    """ Draws the figure on the window. """
+    window.clear()
+
+    # Draw arms.
+    window.draw.line(((0, 0.5), (0.6, -0.1)),
+                     line_width=12,
+                     color=(0, 0, 1, 1))
+    window.draw.line(((0, 0.5), (-0.6, -0.1)),
+                     line_width=12,
+                     color=(0, 0, 1, 1))
+
+    # Draw body.
+    window.draw.triangle((
+        (0, 0.6),
+        (-0.5, -0.4),
+        (0.5, -0.4)
+    ), color=(1, 0, 0, 1))
+
+    # Draw head and eyes.
+    window.draw.circle((0, 0.75), radius=0.25, color=(1, 1, 1, 1))
+    window.draw.dot((-0.1, 0.8), 12, color=(0, 0, 0, 1))
+    window.draw.dot((0.1, 0.8), 12, color=(0, 0, 0, 1))
+
+    # Draw legs.
+    window.draw.rect((-0.225, -0.4), (0.075, 0.5), color=(0, 1, 0, 1))
+    window.draw.rect((0.075, -0.4), (0.075, 0.5), color=(0, 1, 0, 1))
 
 
 if __name__ == "__main__":
     window = pyg.Window(700, 700)
     window.show()
 
-    time_count = 0
+    # The figure never changes, so it's only redrawn when the window's
+    # contents are lost (e.g. when it's resized).
+    dirty = True
+
+    def refresh_callback() -> None:
+        global dirty  # pylint: disable=W0603
+        dirty = True
+
+    window.set_refresh_callback(refresh_callback)
+
+    start_time = timer()
     while not window.should_close():
-        window.name = f"Elapsed time: {time_count:.1f}s"
-
-        # Draw arms.
-        window.draw.line(((0, 0.5), (0.6, -0.1)),
-                         line_width=12,
-                         color=(0, 0, 1, 1))
-        window.draw.line(((0, 0.5), (-0.6, -0.1)),
-                         line_width=12,
-                         color=(0, 0, 1, 1))
-
-        # Draw body.
-        window.draw.triangle((
-            (0, 0.6),
-            (-0.5, -0.4),
-            (0.5, -0.4)
-        ), color=(1, 0, 0, 1))
-
-        # Draw head and eyes.
-        window.draw.circle((0, 0.75), radius=0.25, color=(1, 1, 1, 1))
-        window.draw.dot((-0.1, 0.8), 12, color=(0, 0, 0, 1))
-        window.draw.dot((0.1, 0.8), 12, color=(0, 0, 0, 1))
-
-        # Draw legs.
-        window.draw.rect((-0.225, -0.4), (0.075, 0.5), color=(0, 1, 0, 1))
-        window.draw.rect((0.075, -0.4), (0.075, 0.5), color=(0, 1, 0, 1))
-
-        # Poll for events and update the window.
-        window.poll_events()
-        window.update()
-
-        time.sleep(0.1)
-        time_count += 0.1
+        window.name = f"Elapsed time: {timer() - start_time:.1f}s"
+
+        if dirty:
+            draw_scene(window)
+            window.update()
+            dirty = False
+
+        # Sleep until an event arrives or the title needs to be updated.
+        window.wait_events_timeout(0.1)
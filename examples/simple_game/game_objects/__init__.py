@@ -1,4 +1,5 @@
-from .game_object import GameObject
+from .game_world import GameWorld
+from .game_object import GameObject, boxes_overlap
 from .black_hole import BlackHole
 from .spaceship import Spaceship
 from .planet import Planet
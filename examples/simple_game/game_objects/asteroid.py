@@ -11,6 +11,10 @@ from .game_object import GameObject
 class Asteroid(GameObject):
     """ Represents an asteroid. """
 
+    __slots__ = (
+        "_radius",
+    )
+
     def __init__(self) -> None:
         self._radius = random.uniform(0.025, 0.07)
         spawn_left = bool(random.getrandbits(1))
@@ -28,5 +32,5 @@ class Asteroid(GameObject):
                 ),
             ],
         )
-        self._vel_x = (random.uniform(0.02, 0.35) if spawn_left
-                       else random.uniform(-0.35, -0.02))
+        self.vel_x = (random.uniform(0.02, 0.35) if spawn_left
+                      else random.uniform(-0.35, -0.02))
@@ -1,8 +1,7 @@
 """ Implements the game object that represents a black hole.
 """
 
-from timeit import default_timer as timer
-
+import numpy as np
 import pyg
 
 from .game_object import GameObject
@@ -16,17 +15,25 @@ _BLACK_HOLE_GRAVITY_FACTOR = 0.075
 class BlackHole(GameObject):
     """ Represents a black hole. """
 
+    __slots__ = (
+        "_scaling_counter",
+        "_reverse_scales",
+        "_scaling_time",
+    )
+
     def __init__(self,
                  initial_pos: pyg.utils.Coord2D = (0.82, 0.82),
                  initial_scale: float = 0.8) -> None:
         self._scaling_counter = 0
         self._reverse_scales = False
-        self._last_scaling = 0
+        self._scaling_time = 0.0
 
+        # The black hole's 100 circles are merged into a single object, so
+        # they can be drawn with 2 draw calls (one per fill mode).
         super().__init__(
             initial_pos=initial_pos,
             initial_scale=initial_scale,
-            all_graphics=[
+            all_graphics=[pyg.objects.MergedGraphicObject([
                 pyg.objects.Circle(
                     color=(r/140, r/120, r/100, 1),
                     fill_mode=(pyg.FillMode.POINT if r > 16
@@ -35,28 +42,57 @@ class BlackHole(GameObject):
                     radius=0.15 * r / 100,
                 )
                 for r in range(100)
-            ],
+            ])],
         )
 
     def calc_gravitational_pull(self, obj: GameObject) -> tuple[float, float]:
         """ Calculates the gravitational pull the black hole exerts on the given
         object.
         """
-        d = max(self.distance(obj), 1e-4)
-        g = _BLACK_HOLE_GRAVITY_FACTOR / (d ** 2)
+        # `g / d` is `1 / d^3`, so the distance itself isn't needed.
+        d2 = max(self.distance_sq(obj), 1e-8)
+        inv_d3 = _BLACK_HOLE_GRAVITY_FACTOR * d2 ** -1.5
 
-        gX = g * (self.x - obj.x) / d
-        gY = g * (self.y - obj.y) / d
+        gX = (self.x - obj.x) * inv_d3
+        gY = (self.y - obj.y) * inv_d3
         return gX, gY
 
+    def calc_gravitational_pull_batch(
+        self,
+        xs: np.ndarray,
+        ys: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """ Calculates the gravitational pull the black hole exerts on many
+        objects at once.
+
+        Equivalent to calling :meth:`calc_gravitational_pull` for each object,
+        but vectorized. Since `g / d` is `1 / d^3`, no square root is needed.
+
+        Args:
+            xs: NumPy array with the objects' positions in the x-axis.
+            ys: NumPy array with the objects' positions in the y-axis.
+
+        Returns:
+            A tuple with two NumPy arrays, containing the pulls in the x-axis
+            and in the y-axis.
+        """
+        dx = self.x - xs
+        dy = self.y - ys
+        d2 = np.maximum(dx * dx + dy * dy, 1e-8)
+        inv_d3 = _BLACK_HOLE_GRAVITY_FACTOR * d2 ** -1.5
+        return dx * inv_d3, dy * inv_d3
+
     def update(self, dT: float, *args, **kwargs) -> None:
-        if (timer() - self._last_scaling) >= _MIN_SCALING_INTERVAL:
+        # Take one scaling step per `_MIN_SCALING_INTERVAL` seconds of game
+        # time.
+        self._scaling_time += dT
+        if self._scaling_time >= _MIN_SCALING_INTERVAL:
+            self._scaling_time = 0.0
             sx = sy = (1 / _SCALE_STEP_FACTOR if self._reverse_scales
                        else _SCALE_STEP_FACTOR)
 
             self.scale(sx=sx, sy=sy)
             self._scaling_counter += 1
-            self._last_scaling = timer()
 
             if self._scaling_counter >= 20:
                 self._scaling_counter = 0
@@ -11,24 +11,38 @@ from dataclasses import dataclass
 import pyg
 import numpy as np
 
-
-_MAX_VEL = 0.5
+from .game_world import GameWorld, MAX_VEL
 
 
 class GameObject(ABC):
-    """ Abstract class representing an object in the game. """
+    """ Abstract class representing an object in the game.
+
+    The object's state (position, velocity, angle and scale) is stored in a row
+    of a :class:`GameWorld`. Objects start in a private world of their own and
+    can be moved into a shared world, which updates many objects at once.
+    """
+
+    __slots__ = (
+        "_world",
+        "_row",
+        "_bounding_box",
+        "_bounding_box_graphics",
+        "_points_buffer",
+        "_all_graphics",
+    )
 
     def __init__(self,
-                 all_graphics: list[pyg.objects.SimpleGraphicObject],
+                 all_graphics: list[pyg.objects.GraphicObject],
                  initial_pos: pyg.utils.Coord2D = (0, 0),
                  initial_scale: float = 1.0) -> None:
-        self._x, self._y = (0.0, 0.0)
-        self.vel_x = self.vel_y = 0.0
-        self._angle = 90.0
-        self._vel_angular = 0.0
-        self._scale_x = self._scale_y = 1.0
+        self._world = GameWorld(capacity=1)
+        self._row = 0
+        self._world.objects.append(self)
+        self._world.angle[0] = 90.0
 
         self._bounding_box: Optional[BoundingBox] = None
+        self._bounding_box_graphics: list[pyg.objects.GraphicObject] = []
+        self._points_buffer = np.empty((0, 2), dtype=np.float32)
         self._all_graphics = all_graphics
 
         if initial_pos != (0, 0):
@@ -36,47 +50,87 @@ class GameObject(ABC):
         if initial_scale != 1:
             self.scale(sx=initial_scale, sy=initial_scale)
 
+    @property
+    def world(self) -> GameWorld:
+        """ The world storing the object's state. """
+        return self._world
+
     @property
     def x(self) -> float:
         """ The object's position in the x-axis. """
-        return self._x
+        return float(self._world.pos[self._row, 0])
 
     @property
     def y(self) -> float:
         """ The object's position in the y-axis. """
-        return self._y
+        return float(self._world.pos[self._row, 1])
+
+    @property
+    def vel_x(self) -> float:
+        """ The object's velocity in the x-axis. """
+        return float(self._world.vel[self._row, 0])
+
+    @vel_x.setter
+    def vel_x(self, new_vel: float) -> None:
+        self._world.vel[self._row, 0] = new_vel
 
     @property
-    def graphics(self) -> list[pyg.objects.SimpleGraphicObject]:
+    def vel_y(self) -> float:
+        """ The object's velocity in the y-axis. """
+        return float(self._world.vel[self._row, 1])
+
+    @vel_y.setter
+    def vel_y(self, new_vel: float) -> None:
+        self._world.vel[self._row, 1] = new_vel
+
+    @property
+    def angle(self) -> float:
+        """ The object's angle around the z-axis, in degrees. """
+        return float(self._world.angle[self._row])
+
+    @property
+    def graphics(self) -> list[pyg.objects.GraphicObject]:
         """ List with the graphic objects that compose this object. """
         return self._all_graphics
 
     @property
     def bounding_box(self) -> BoundingBox:
-        """ The object's bounding box. """
-        if self._bounding_box is not None:
+        """ The object's bounding box.
+
+        The box is cached. Translations and scalings (and rotations by
+        multiples of 90 degrees around the z-axis) update the cached box
+        directly, while other rotations or changes to the object's graphics
+        cause it to be recomputed from the vertices.
+        """
+        graphics = self.graphics
+        if (self._bounding_box is not None
+                and graphics == self._bounding_box_graphics):
             return self._bounding_box
 
-        min_x = min_y = float("inf")
-        max_x = max_y = -float("inf")
-        for graphic_object in self.graphics:
-            vertices = graphic_object.vertices
-            vertices = np.matmul(
-                graphic_object.transform.matrix,
-                np.append(vertices, np.ones((vertices.shape[0], 1)), axis=1).T,
-            )
-            for x, y, _, _ in vertices.T:
-                min_x = min(min_x, x)
-                max_x = max(max_x, x)
-                min_y = min(min_y, y)
-                max_y = max(max_y, y)
-
-        return BoundingBox(
-            x=min_x,
-            y=max_y,
-            width=max_x - min_x,
-            height=max_y - min_y,
+        # Transform the vertices of all the graphic objects to world
+        # coordinates (only x and y are needed) and find their extremes. The
+        # points are written into a buffer that is reused between calls.
+        num_points = sum(len(g.vertices) for g in graphics)
+        if len(self._points_buffer) != num_points:
+            self._points_buffer = np.empty((num_points, 2), dtype=np.float32)
+
+        start = 0
+        for graphic_object in graphics:
+            matrix = graphic_object.transform.matrix
+            end = start + len(graphic_object.vertices)
+            points = self._points_buffer[start:end]
+            np.matmul(graphic_object.vertices, matrix[:2, :3].T, out=points)
+            points += matrix[:2, 3]
+            start = end
+
+        min_x, min_y = self._points_buffer.min(axis=0)
+        max_x, max_y = self._points_buffer.max(axis=0)
+
+        self._bounding_box = BoundingBox.from_extremes(
+            float(min_x), float(min_y), float(max_x), float(max_y),
         )
+        self._bounding_box_graphics = list(graphics)
+        return self._bounding_box
 
     def is_colliding_with(self, other: GameObject) -> bool:
         """ Checks if this object is colliding with the given object. """
@@ -89,9 +143,11 @@ class GameObject(ABC):
         )
 
     def render(self, window: pyg.Window) -> None:
-        """ Renders the object in the given window. """
+        """ Queues the object's graphics to be drawn in the given window (see
+        :meth:`pyg.Window.flush`).
+        """
         for graphic_object in self.graphics:
-            window.draw(graphic_object)
+            window.queue(graphic_object)
 
     def distance(self, other: GameObject) -> float:
         """ Calculates the euclidean distance between this object and the given
@@ -104,9 +160,18 @@ class GameObject(ABC):
             The euclidean distance between the objects' centers, in OpenGL
             window coordinates.
         """
-        return math.sqrt(
-            ((self.x - other.x) ** 2) + ((self.y - other.y) ** 2)
-        )
+        return math.hypot(self.x - other.x, self.y - other.y)
+
+    def distance_sq(self, other: GameObject) -> float:
+        """ Calculates the squared euclidean distance between this object and
+        the given object, in OpenGL window coordinates.
+
+        Cheaper than :meth:`distance`, since no square root is needed. Prefer
+        it when comparing distances or when the distance would be squared
+        anyway.
+        """
+        dx, dy = self.x - other.x, self.y - other.y
+        return dx * dx + dy * dy
 
     def update(self,
                dT: float,
@@ -128,25 +193,27 @@ class GameObject(ABC):
                            ty=self.vel_y * dT)
 
         # Handle rotational movement.
-        if abs(self._vel_angular) >= 1e-3:
-            self.rotate(angle=self._vel_angular * dT,
+        vel_angular = float(self._world.vel_angular[self._row])
+        if abs(vel_angular) >= 1e-3:
+            self.rotate(angle=vel_angular * dT,
                         axis="z")
 
         # Handle translational acceleration.
-        self.vel_x += aX * dT
-        self.vel_y += aY * dT
-
-        self.vel_x = max(min(self.vel_x, _MAX_VEL), -_MAX_VEL)
-        self.vel_y = max(min(self.vel_y, _MAX_VEL), -_MAX_VEL)
+        self.vel_x = max(min(self.vel_x + aX * dT, MAX_VEL), -MAX_VEL)
+        self.vel_y = max(min(self.vel_y + aY * dT, MAX_VEL), -MAX_VEL)
 
         # Handle rotational acceleration.
-        self._vel_angular += rot_accel_z * dT
+        self._world.vel_angular[self._row] += rot_accel_z * dT
 
     def translate(self, tx: float = 0.0, ty: float = 0.0) -> None:
         """ Translates the object by the given offset. """
-        self._bounding_box = None
-        self._x += tx
-        self._y += ty
+        if self._bounding_box is not None:
+            box = self._bounding_box
+            self._bounding_box = BoundingBox(x=box.x + tx,
+                                             y=box.y + ty,
+                                             width=box.width,
+                                             height=box.height)
+        self._world.pos[self._row] += (tx, ty)
         for graphic_object in self._all_graphics:
             graphic_object.transform.translate(tx, ty)
 
@@ -160,15 +227,30 @@ class GameObject(ABC):
             axis: The axis around which the object will rotate. Defaults to the
                 z-axis.
         """
-        self._bounding_box = None
-        self._angle = (self._angle + angle) % 360
-        for graphic_object in self._all_graphics:
-            # To rotate the object around its center, we must apply some
-            # translations. See:
-            # https://math.stackexchange.com/questions/2093314/rotation-matrix-of-rotation-around-a-point-other-than-the-origin  # noqa
-            graphic_object.transform.translate(tx=-self._x, ty=-self._y)
-            graphic_object.transform.rotate(angle, axis)
-            graphic_object.transform.translate(tx=self._x, ty=self._y)
+        x, y = self.x, self.y
+        if self._bounding_box is not None:
+            if axis == "z" and angle % 90 == 0:
+                # Rotating the box by a multiple of 90 degrees gives the exact
+                # box of the rotated vertices.
+                rad = math.radians(angle)
+                cos, sin = round(math.cos(rad)), round(math.sin(rad))
+                xs, ys = [], []
+                for cx, cy in self._bounding_box.corners():
+                    dx, dy = cx - x, cy - y
+                    xs.append(x + dx * cos - dy * sin)
+                    ys.append(y + dx * sin + dy * cos)
+                self._bounding_box = BoundingBox.from_extremes(
+                    min(xs), min(ys), max(xs), max(ys),
+                )
+            else:
+                self._bounding_box = None
+        self._world.angle[self._row] = (self.angle + angle) % 360
+        # To rotate the object around its center, we must apply some
+        # translations. See:
+        # https://math.stackexchange.com/questions/2093314/rotation-matrix-of-rotation-around-a-point-other-than-the-origin  # noqa
+        self._transform_about_center(
+            pyg.TransformationHandler.rotation_matrix(angle, axis), x, y,
+        )
 
     def scale(self, sx: float = 1.0, sy: float = 1.0) -> None:
         """ Scales the object.
@@ -177,16 +259,57 @@ class GameObject(ABC):
             sx: Scale factor for the x-axis.
             sy: Scale factor for the y-axis.
         """
-        self._bounding_box = None
-        self._scale_x *= sx
-        self._scale_y *= sy
+        x, y = self.x, self.y
+        if self._bounding_box is not None:
+            # Scale the box around the object's position.
+            box = self._bounding_box
+            xs = [x + (box.x - x) * sx, x + (box.x + box.width - x) * sx]
+            ys = [y + (box.y - box.height - y) * sy, y + (box.y - y) * sy]
+            self._bounding_box = BoundingBox.from_extremes(
+                min(xs), min(ys), max(xs), max(ys),
+            )
+        self._world.scale[self._row] *= (sx, sy)
+        # To scale the object without moving its center, we must apply some
+        # translations. See:
+        # https://math.stackexchange.com/questions/2093314/rotation-matrix-of-rotation-around-a-point-other-than-the-origin  # noqa
+        self._transform_about_center(
+            pyg.TransformationHandler.scaling_matrix(sx=sx, sy=sy), x, y,
+        )
+
+    def _transform_about_center(self,
+                                matrix: np.ndarray,
+                                x: float,
+                                y: float) -> None:
+        """ Applies a transformation to all the object's graphics around the
+        point `(x, y)`.
+
+        The translations to and from the point are folded into a single matrix,
+        computed once and shared by all the graphics.
+        """
+        handler = pyg.TransformationHandler
+        matrix = (handler.translation_matrix(tx=x, ty=y)
+                  @ matrix
+                  @ handler.translation_matrix(tx=-x, ty=-y))
         for graphic_object in self._all_graphics:
-            # To scale the object without moving its center, we must apply some
-            # translations. See:
-            # https://math.stackexchange.com/questions/2093314/rotation-matrix-of-rotation-around-a-point-other-than-the-origin  # noqa
-            graphic_object.transform.translate(tx=-self._x, ty=-self._y)
-            graphic_object.transform.scale(sx=sx, sy=sy)
-            graphic_object.transform.translate(tx=self._x, ty=self._y)
+            graphic_object.transform(matrix)
+
+
+def boxes_overlap(boxes1: np.ndarray, boxes2: np.ndarray) -> np.ndarray:
+    """ Vectorized version of :meth:`GameObject.is_colliding_with`.
+
+    Args:
+        boxes1: Array with shape `(..., 4)` containing the `x`, `y`, `width`
+            and `height` of bounding boxes (see :class:`BoundingBox`).
+        boxes2: Array with the same layout as `boxes1`. The arrays are
+            broadcast against each other (excluding their last axes).
+
+    Returns:
+        A boolean array indicating which pairs of boxes overlap.
+    """
+    x1, y1, w1, h1 = np.moveaxis(boxes1, -1, 0)
+    x2, y2, w2, h2 = np.moveaxis(boxes2, -1, 0)
+    return ((x1 < x2 + w2) & (x1 + w1 > x2)
+            & (y1 > y2 - h2) & (y1 - h1 < y2))
 
 
 @dataclass(frozen=True)
@@ -195,3 +318,19 @@ class BoundingBox:
     y: float
     width: float
     height: float
+
+    @classmethod
+    def from_extremes(cls,
+                      min_x: float,
+                      min_y: float,
+                      max_x: float,
+                      max_y: float) -> BoundingBox:
+        """ Creates a bounding box from its minimum and maximum coordinates. """
+        return cls(x=min_x, y=max_y, width=max_x - min_x, height=max_y - min_y)
+
+    def corners(self) -> list[pyg.utils.Coord2D]:
+        """ Returns the coordinates of the box's 4 corners. """
+        return [(self.x, self.y),
+                (self.x + self.width, self.y),
+                (self.x, self.y - self.height),
+                (self.x + self.width, self.y - self.height)]
@@ -0,0 +1,217 @@
+""" Implements a container that stores the state of many game objects in
+contiguous arrays.
+"""
+
+from __future__ import annotations
+
+import dataclasses
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from pyg.objects import GraphicObject
+    from .game_object import GameObject
+
+
+#: Maximum velocity of an object, in each axis.
+MAX_VEL = 0.5
+
+
+class GameWorld:
+    """ Stores the state of many game objects as a "structure of arrays".
+
+    The positions, velocities, angles and scales of all the objects in the
+    world are kept in contiguous NumPy arrays (one row per object), so they can
+    be updated with a few vectorized operations instead of one Python call per
+    object. The rows of the objects are kept packed: removing an object moves
+    the last object into its row.
+
+    Attributes:
+        pos: Array with shape `(capacity, 2)` with the objects' positions.
+        vel: Array with shape `(capacity, 2)` with the objects' velocities.
+        angle: Array with shape `(capacity,)` with the objects' angles, in
+            degrees.
+        vel_angular: Array with shape `(capacity,)` with the objects' angular
+            velocities, in degrees/s.
+        scale: Array with shape `(capacity, 2)` with the objects' scales.
+    """
+
+    def __init__(self, capacity: int = 16) -> None:
+        self._objects: list[GameObject] = []
+        self.pos = np.zeros((capacity, 2), dtype=np.float32)
+        self.vel = np.zeros((capacity, 2), dtype=np.float32)
+        self.angle = np.zeros(capacity, dtype=np.float32)
+        self.vel_angular = np.zeros(capacity, dtype=np.float32)
+        self.scale = np.ones((capacity, 2), dtype=np.float32)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    @property
+    def objects(self) -> list[GameObject]:
+        """ The objects in the world, in the order of their rows. """
+        return self._objects
+
+    def _grow(self) -> None:
+        """ Doubles the capacity of the world's arrays. """
+        for name in ("pos", "vel", "angle", "vel_angular", "scale"):
+            array = getattr(self, name)
+            new_array = (np.ones if name == "scale" else np.zeros)(
+                (2 * len(array), *array.shape[1:]), dtype=array.dtype,
+            )
+            new_array[:len(array)] = array
+            setattr(self, name, new_array)
+
+    def add(self, obj: GameObject) -> None:
+        """ Moves an object into the world. Its state is copied into a new row
+        of the world's arrays.
+        """
+        if len(self._objects) == len(self.pos):
+            self._grow()
+
+        row = len(self._objects)
+        # pylint: disable=W0212
+        old_world, old_row = obj._world, obj._row
+        self.pos[row] = old_world.pos[old_row]
+        self.vel[row] = old_world.vel[old_row]
+        self.angle[row] = old_world.angle[old_row]
+        self.vel_angular[row] = old_world.vel_angular[old_row]
+        self.scale[row] = old_world.scale[old_row]
+
+        if obj in old_world.objects:
+            old_world.remove(obj, keep_state=False)
+
+        self._objects.append(obj)
+        obj._world, obj._row = self, row
+
+    def remove(self, obj: GameObject, keep_state: bool = True) -> None:
+        """ Removes an object from the world.
+
+        Args:
+            obj: The object to be removed.
+            keep_state: Whether to move the object's state into a new private
+                world, so it can still be used.
+        """
+        # pylint: disable=W0212
+        row = obj._row
+        assert obj._world is self and self._objects[row] is obj
+
+        # Adding the object to another world removes it from this one.
+        if keep_state:
+            GameWorld(capacity=1).add(obj)
+            return
+
+        # Move the last object into the freed row.
+        last = len(self._objects) - 1
+        if row != last:
+            moved = self._objects[last]
+            for array in (self.pos, self.vel, self.angle, self.vel_angular,
+                          self.scale):
+                array[row] = array[last]
+            self._objects[row] = moved
+            moved._row = row
+        self._objects.pop()
+
+    def _move(self,
+              rows: np.ndarray,
+              deltas: np.ndarray,
+              angles: np.ndarray,
+              rotating: np.ndarray) -> None:
+        """ Translates and then rotates (around their new positions) some of
+        the objects in the world.
+
+        Equivalent to calling :meth:`GameObject.translate` and
+        :meth:`GameObject.rotate` on each object, but the transformations of
+        all the objects' graphics are composed with a single batched matrix
+        multiplication.
+
+        Args:
+            rows: The rows of the objects to be moved.
+            deltas: Array with shape `(len(rows), 2)` with the translations.
+            angles: Array with shape `(len(rows),)` with the rotation angles,
+                in degrees, around the z-axis.
+            rotating: Boolean array with shape `(len(rows),)` indicating which
+                objects are rotated.
+        """
+        old_pos = self.pos[rows].copy()
+        self.pos[rows] += deltas
+        self.angle[rows] = (self.angle[rows] + angles) % 360
+        new_pos = self.pos[rows]
+
+        # The transformation of each object is a rotation around its new
+        # position applied after the translation: T(new) @ R @ T(-old).
+        rad = np.radians(angles)
+        cos, sin = np.cos(rad), np.sin(rad)
+        matrices = np.zeros((len(rows), 4, 4), dtype=np.float32)
+        matrices[:, 0, 0] = cos
+        matrices[:, 0, 1] = -sin
+        matrices[:, 1, 0] = sin
+        matrices[:, 1, 1] = cos
+        matrices[:, 2, 2] = matrices[:, 3, 3] = 1
+        matrices[:, 0, 3] = (new_pos[:, 0]
+                             - (cos * old_pos[:, 0] - sin * old_pos[:, 1]))
+        matrices[:, 1, 3] = (new_pos[:, 1]
+                             - (sin * old_pos[:, 0] + cos * old_pos[:, 1]))
+
+        # Gather the graphics' model matrices, transform all of them at once
+        # and scatter them back.
+        # pylint: disable=W0212
+        graphics: list[GraphicObject] = []
+        owners: list[int] = []
+        for k, row in enumerate(rows):
+            obj = self._objects[row]
+            if rotating[k]:
+                obj._bounding_box = None
+            elif obj._bounding_box is not None:
+                box = obj._bounding_box
+                obj._bounding_box = dataclasses.replace(
+                    box,
+                    x=box.x + float(deltas[k, 0]),
+                    y=box.y + float(deltas[k, 1]),
+                )
+            graphics += obj._all_graphics
+            owners += [k] * len(obj._all_graphics)
+
+        if graphics:
+            models = np.matmul(
+                matrices[owners],
+                np.stack([g.transform.matrix for g in graphics]),
+            )
+            for graphic, model in zip(graphics, models):
+                graphic.transform.matrix = model
+
+    def update(self,
+               dT: float,
+               accel: np.ndarray | float = 0.0,
+               rot_accel: np.ndarray | float = 0.0) -> None:
+        """ Updates the state of all the objects in the world.
+
+        Equivalent to calling :meth:`GameObject.update` on each object, with
+        the state math done in a few vectorized operations.
+
+        Args:
+            dT: Time elapsed, in seconds, since the last update.
+            accel: Array with shape `(n, 2)` with the objects' translational
+                accelerations (or a single value for all of them).
+            rot_accel: Array with shape `(n,)` with the objects' rotational
+                accelerations around the z-axis, in degrees/s^2 (or a single
+                value for all of them).
+        """
+        n = len(self._objects)
+        vel, vel_angular = self.vel[:n], self.vel_angular[:n]
+
+        # Apply the movements to the objects (and their graphics).
+        moving = (np.abs(vel) >= 1e-5).any(axis=1)
+        rotating = np.abs(vel_angular) >= 1e-3
+        rows = np.flatnonzero(moving | rotating)
+        if len(rows) > 0:
+            self._move(rows,
+                       np.where(moving[rows, np.newaxis], vel[rows] * dT, 0),
+                       np.where(rotating[rows], vel_angular[rows] * dT, 0),
+                       rotating[rows])
+
+        # Update the velocities.
+        vel += np.asarray(accel, dtype=np.float32) * dT
+        np.clip(vel, -MAX_VEL, MAX_VEL, out=vel)
+        vel_angular += np.asarray(rot_accel, dtype=np.float32) * dT
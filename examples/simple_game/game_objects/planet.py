@@ -9,13 +9,16 @@ from .game_object import GameObject
 class Planet(GameObject):
     """ Represents a planet. """
 
+    __slots__ = ()
+
     def __init__(self,
                  initial_pos: pyg.utils.Coord2D = (-0.89, 0.89),
                  initial_scale: float = 1) -> None:
         super().__init__(
             initial_pos=initial_pos,
             initial_scale=initial_scale,
-            all_graphics=[
+            # The planet is drawn as a single object, with one draw call.
+            all_graphics=[pyg.objects.MergedGraphicObject([
                 pyg.objects.Circle(
                     color=(0, 162/255, 205/255, 1),
                     center_pos=(0, 0),
@@ -91,5 +94,5 @@ class Planet(GameObject):
                     top_left=(0.01, -0.06),
                     size=(0.005, 0.005),
                 ),
-            ],
+            ])],
         )
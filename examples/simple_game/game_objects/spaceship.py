@@ -2,7 +2,8 @@
 player.
 """
 
-import math
+import itertools
+from typing import Optional
 
 import pyg
 
@@ -25,16 +26,26 @@ class Spaceship(GameObject):
             rotation" engines are on.
     """
 
+    __slots__ = (
+        "_upper_engines_on",
+        "_lower_engines_on",
+        "_clockwise_rotation_engines_on",
+        "_anticlockwise_rotation_engines_on",
+        "_graphics",
+        "_merged_graphics",
+    )
+
     def __init__(self,
                  initial_pos: pyg.utils.Coord2D = (0.75, -0.9),
                  initial_scale: float = 1.0) -> None:
-        self.upper_engines_on = False
-        self.lower_engines_on = False
-        self.clockwise_rotation_engines_on = False
-        self.anticlockwise_rotation_engines_on = False
+        self._upper_engines_on = False
+        self._lower_engines_on = False
+        self._clockwise_rotation_engines_on = False
+        self._anticlockwise_rotation_engines_on = False
+        self._graphics: Optional[list[pyg.objects.GraphicObject]] = None
 
         # Specify the graphics for the spaceship's body.
-        self._spaceship_graphics = [
+        body = [
             # Bottom-left turbine
             pyg.objects.Triangle(
                 color=(0.65, 0.65, 0.65, 1),
@@ -83,7 +94,7 @@ class Spaceship(GameObject):
         ]
 
         # Specify the graphics for the "combustion flames" of the lower engines.
-        self._lower_combustion_graphics = [
+        lower_combustion = [
             # Bottom-left turbine flame
             pyg.objects.Triangle(
                 color=(1, 0, 0, 1),
@@ -105,7 +116,7 @@ class Spaceship(GameObject):
         ]
 
         # Specify the graphics for the "combustion flames" of the upper engines.
-        self._upper_combustion_graphics = [
+        upper_combustion = [
             # Top-left turbine flame
             pyg.objects.Triangle(
                 color=(1, 0, 0, 1),
@@ -128,7 +139,7 @@ class Spaceship(GameObject):
 
         # Specify the graphics for the "combustion flames" of the "clockwise
         # rotation" engines.
-        self._clockwise_rotation_graphics = [
+        clockwise_combustion = [
             # Top-right rotation turbine flame
             pyg.objects.Triangle(
                 color=(0.2, 0.4, 1, 1),
@@ -151,7 +162,7 @@ class Spaceship(GameObject):
 
         # Specify the graphics for the "combustion flames" of the
         # "anti-clockwise rotation" engines.
-        self._anticlockwise_rotation_graphics = [
+        anticlockwise_combustion = [
             # Top-left rotation turbine flame
             pyg.objects.Triangle(
                 color=(0.2, 0.4, 1, 1),
@@ -172,44 +183,95 @@ class Spaceship(GameObject):
             ),
         ]
 
+        # The triangles shown in each combination of engine states are merged
+        # into a single graphic object, so the spaceship is always drawn with a
+        # single draw call. The combinations are indexed by the states of the
+        # lower, upper, clockwise and anti-clockwise rotation engines.
+        flames = (lower_combustion,
+                  upper_combustion,
+                  clockwise_combustion,
+                  anticlockwise_combustion)
+        self._merged_graphics = {
+            state: pyg.objects.MergedGraphicObject([
+                *(triangle
+                  for on, group in zip(state, flames) if on
+                  for triangle in group),
+                *body,
+            ])
+            for state in itertools.product((False, True), repeat=4)
+        }
+
         # Call the constructor of the parent class.
         super().__init__(
             initial_pos=initial_pos,
             initial_scale=initial_scale,
-            all_graphics=[
-                *self._lower_combustion_graphics,
-                *self._upper_combustion_graphics,
-                *self._clockwise_rotation_graphics,
-                *self._anticlockwise_rotation_graphics,
-                *self._spaceship_graphics,
-            ],
+            all_graphics=list(self._merged_graphics.values()),
         )
 
     @property
-    def graphics(self) -> list[pyg.objects.SimpleGraphicObject]:
-        """ List with all the graphic objects associated with this game object
-        that should be rendered.
-        """
-        comb_graphics = []
+    def upper_engines_on(self) -> bool:
+        """ Whether the upper engines are on. """
+        return self._upper_engines_on
 
-        if self.lower_engines_on:
-            comb_graphics += self._lower_combustion_graphics
-        if self.upper_engines_on:
-            comb_graphics += self._upper_combustion_graphics
+    @upper_engines_on.setter
+    def upper_engines_on(self, on: bool) -> None:
+        self._upper_engines_on = on
+        self._graphics = None
 
-        if self.clockwise_rotation_engines_on:
-            comb_graphics += self._clockwise_rotation_graphics
-        if self.anticlockwise_rotation_engines_on:
-            comb_graphics += self._anticlockwise_rotation_graphics
+    @property
+    def lower_engines_on(self) -> bool:
+        """ Whether the lower engines are on. """
+        return self._lower_engines_on
+
+    @lower_engines_on.setter
+    def lower_engines_on(self, on: bool) -> None:
+        self._lower_engines_on = on
+        self._graphics = None
 
-        return comb_graphics + self._spaceship_graphics
+    @property
+    def clockwise_rotation_engines_on(self) -> bool:
+        """ Whether the "clockwise rotation" engines are on. """
+        return self._clockwise_rotation_engines_on
+
+    @clockwise_rotation_engines_on.setter
+    def clockwise_rotation_engines_on(self, on: bool) -> None:
+        self._clockwise_rotation_engines_on = on
+        self._graphics = None
+
+    @property
+    def anticlockwise_rotation_engines_on(self) -> bool:
+        """ Whether the "anti-clockwise rotation" engines are on. """
+        return self._anticlockwise_rotation_engines_on
+
+    @anticlockwise_rotation_engines_on.setter
+    def anticlockwise_rotation_engines_on(self, on: bool) -> None:
+        self._anticlockwise_rotation_engines_on = on
+        self._graphics = None
+
+    @property
+    def graphics(self) -> list[pyg.objects.GraphicObject]:
+        """ List with all the graphic objects associated with this game object
+        that should be rendered.
+
+        The list is cached and only rebuilt after the state of an engine
+        changes.
+        """
+        if self._graphics is None:
+            self._graphics = [self._merged_graphics[(
+                self._lower_engines_on,
+                self._upper_engines_on,
+                self._clockwise_rotation_engines_on,
+                self._anticlockwise_rotation_engines_on,
+            )]]
+        return self._graphics
 
     def shut_down_engines(self) -> None:
         """ Shuts down all the spaceship's engines. """
-        self.lower_engines_on = False
-        self.upper_engines_on = False
-        self.clockwise_rotation_engines_on = False
-        self.anticlockwise_rotation_engines_on = False
+        self._lower_engines_on = False
+        self._upper_engines_on = False
+        self._clockwise_rotation_engines_on = False
+        self._anticlockwise_rotation_engines_on = False
+        self._graphics = None
 
     def update(self,
                dT: float,
@@ -232,9 +294,9 @@ class Spaceship(GameObject):
         if self.upper_engines_on:
             a += _VERTICAL_ENGINES_ACCELERATION
 
-        angle_rads = math.pi * (self._angle / 180)
-        aX = gX - a * math.cos(angle_rads)
-        aY = gY - a * math.sin(angle_rads)
+        sin, cos = pyg.utils.fast_sincos(self.angle)
+        aX = gX - a * cos
+        aY = gY - a * sin
 
         # Calculate the spaceship's rotational acceleration around the z-axis.
         rot_accel_z = 0
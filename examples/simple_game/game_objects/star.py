@@ -2,6 +2,7 @@
 """
 
 import random
+from typing import Optional
 
 import pyg
 
@@ -11,10 +12,27 @@ from .game_object import GameObject
 class Star(GameObject):
     """ Represents a start. """
 
-    def __init__(self) -> None:
+    __slots__ = ()
+
+    def __init__(self,
+                 initial_pos: Optional[pyg.utils.Coord2D] = None,
+                 initial_scale: Optional[float] = None) -> None:
+        """ Creates a new star.
+
+        Args:
+            initial_pos: The star's position. If not provided, a random
+                position is used.
+            initial_scale: The star's scale. If not provided, a random scale is
+                used.
+        """
+        if initial_pos is None:
+            initial_pos = (random.uniform(-1, 1), random.uniform(-1, 1))
+        if initial_scale is None:
+            initial_scale = random.uniform(0.001, 0.02)
+
         super().__init__(
-            initial_pos=(random.uniform(-1, 1), random.uniform(-1, 1)),
-            initial_scale=random.uniform(0.001, 0.02),
+            initial_pos=initial_pos,
+            initial_scale=initial_scale,
             all_graphics=[
                 pyg.objects.Circle(
                     center_pos=(0, 0),
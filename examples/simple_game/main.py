@@ -1,13 +1,16 @@
 """ Simple space exploration game using `pyg`.
 """
 
-import time
+from dataclasses import astuple
 from timeit import default_timer as timer
 
+import numpy as np
 import pyg
 
 import ascii_arts
-from game_objects import Spaceship, BlackHole, Planet, Star, Asteroid
+from game_objects import (
+    GameWorld, Spaceship, BlackHole, Planet, Star, Asteroid, boxes_overlap,
+)
 
 
 _MAX_FPS = 60
@@ -20,14 +23,28 @@ if __name__ == "__main__":
     # Create and show a new window.
     window = pyg.Window(*_WINDOW_SIZE)
     window.name = "Space exploration"
+    window.set_frame_cap(_MAX_FPS)
     window.show()
 
     # Game objects.
     spaceship = Spaceship()
     black_hole = BlackHole()
     planet = Planet()
-    stars = [Star() for _ in range(_NUM_STARS)]
-    asteroids = [Asteroid()]
+
+    # The stars never move, so their graphics are merged into a single object,
+    # drawn with 2 draw calls (one per fill mode).
+    star_positions = np.random.uniform(-1, 1, size=(_NUM_STARS, 2))
+    star_scales = np.random.uniform(0.001, 0.02, size=_NUM_STARS)
+    star_field = pyg.objects.MergedGraphicObject([
+        graphic
+        for (x, y), scale in zip(star_positions.tolist(), star_scales.tolist())
+        for graphic in Star(initial_pos=(x, y), initial_scale=scale).graphics
+    ])
+
+    # The asteroids share a world, so their states are updated all at once.
+    asteroid_world = GameWorld()
+    asteroid_world.add(Asteroid())
+    asteroids = asteroid_world.objects
 
     # Function to handle keyboard events.
     def handle_controls() -> None:
@@ -41,13 +58,15 @@ if __name__ == "__main__":
             spaceship.upper_engines_on = True
 
     # Time references.
-    last_update_time = timer()
-    last_asteroid_time = timer()
+    last_update_time = last_asteroid_time = timer()
 
     # Main loop.
     is_game_over = False
     while not window.should_close() and not is_game_over:
-        loop_start_time = timer()
+        # The clock is read once per frame.
+        now = timer()
+        dT = now - last_update_time
+        last_update_time = now
 
         # Handle controls.
         spaceship.shut_down_engines()
@@ -58,38 +77,45 @@ if __name__ == "__main__":
         window.clear()
 
         # Update the objects.
-        dT = timer() - last_update_time
         spaceship.update(dT, *black_hole.calc_gravitational_pull(spaceship))
         black_hole.update(dT)
-        for asteroid in asteroids:
-            asteroid.update(dT, *black_hole.calc_gravitational_pull(asteroid))
-        last_update_time = timer()
+        positions = asteroid_world.pos[:len(asteroid_world)]
+        asteroid_world.update(dT, accel=np.stack(
+            black_hole.calc_gravitational_pull_batch(positions[:, 0],
+                                                     positions[:, 1]),
+            axis=1,
+        ))
 
         # Draw the game's objects.
-        for star in stars:
-            star.render(window)
+        window.queue(star_field)
         for asteroid in asteroids:
             asteroid.render(window)
         planet.render(window)
         black_hole.render(window)
         spaceship.render(window)
-
-        # Handle collisions between asteroids.
-        asteroids_indices_to_delete = set()
-        for i in range(len(asteroids)):
-            if (asteroids[i].is_colliding_with(black_hole)
-                    or abs(asteroids[i].x) > 1.1
-                    or abs(asteroids[i].y) > 1.1):
-                asteroids_indices_to_delete.add(i)
-            else:
-                for j in range(i + 1, len(asteroids)):
-                    if asteroids[i].is_colliding_with(asteroids[j]):
-                        asteroids[i].vel_x = -asteroids[i].vel_x
-                        asteroids[i].vel_y = -asteroids[i].vel_y
-                        asteroids[j].vel_x = -asteroids[j].vel_x
-                        asteroids[j].vel_y = -asteroids[j].vel_y
-        asteroids = [a for i, a in enumerate(asteroids)
-                     if i not in asteroids_indices_to_delete]
+        window.flush()
+
+        # Handle collisions between asteroids. Asteroids that entered the black
+        # hole or left the viewport are deleted. Each colliding pair of the
+        # remaining asteroids reverses both asteroids' velocities.
+        num_asteroids = len(asteroid_world)
+        boxes = np.array([astuple(a.bounding_box) for a in asteroids],
+                         dtype=np.float32).reshape(num_asteroids, 4)
+        positions = asteroid_world.pos[:num_asteroids]
+        to_delete = (
+            boxes_overlap(boxes, np.array(astuple(black_hole.bounding_box)))
+            | (np.abs(positions) > 1.1).any(axis=1)
+        )
+        collisions = np.triu(boxes_overlap(boxes[:, np.newaxis],
+                                           boxes[np.newaxis]), k=1)
+        collisions[to_delete] = False
+        flips = (collisions.sum(axis=0) + collisions.sum(axis=1)) % 2 == 1
+        asteroid_world.vel[:num_asteroids][flips] *= -1
+        # Removing an asteroid moves the last one into its row, so the rows
+        # are visited from the last to the first.
+        for i in np.flatnonzero(to_delete)[::-1]:
+            asteroid_world.remove(asteroids[i], keep_state=False)
+        asteroid_boxes = boxes[~to_delete]
 
         # Check if the spaceship has left the viewport.
         if abs(spaceship.x) > 1.3 or abs(spaceship.y) > 1.3:
@@ -122,28 +148,22 @@ if __name__ == "__main__":
             continue
 
         # Check if the spaceship collided with an asteroid.
-        for asteroid in asteroids:
-            if spaceship.is_colliding_with(asteroid):
-                is_game_over = True
-        if is_game_over:
+        if boxes_overlap(asteroid_boxes,
+                         np.array(astuple(spaceship.bounding_box))).any():
+            is_game_over = True
             print(f"{ascii_arts.LOSE_ASCII}\n"
                   f"{ascii_arts.ASTEROID_ASCII}\n"
                   "Your spaceship collided with an asteroid.")
             continue
 
         # Spawn new asteroids.
-        if (timer() - last_asteroid_time) >= _ASTEROID_SPAWN_TIME:
-            asteroids.append(Asteroid())
-            last_asteroid_time = timer()
+        if (now - last_asteroid_time) >= _ASTEROID_SPAWN_TIME:
+            asteroid_world.add(Asteroid())
+            last_asteroid_time = now
 
-        # Update the window.
+        # Update the window (this also enforces the FPS limit).
         window.update()
 
-        # Enforce the FPS limit.
-        loop_dT = timer() - loop_start_time
-        waiting_time = (1 / _MAX_FPS) - loop_dT
-        time.sleep(max(waiting_time, 0))
-
-        # Display FPS.
-        window.name = (f"FPS: "
-                       f"{_MAX_FPS if waiting_time > 0 else (1 / loop_dT):.1f}")
+        # Display FPS (measured over the previous frame).
+        if dT > 0:
+            window.name = f"FPS: {1 / dT:.1f}"
@@ -10,7 +10,6 @@ Controls:
 
 import pyg
 import numpy as np
-import time
 
 
 FILL_MODE = pyg.FillMode.LINE
@@ -1803,15 +1802,11 @@ if __name__ == "__main__":
     # Set the callback.
     window.set_key_callback(handle_key_event)
 
-    # Main loop.
-    while not window.should_close():
-        # Clear the window.
-        window.clear()
+    # Draws a frame.
+    def draw_frame(win: pyg.Window) -> None:
+        win.clear()
+        win.draw(teapot)
 
-        # Draw the teapot.
-        window.draw(teapot)
-
-        # Poll for events and update the window.
-        window.wait_events()
-        window.update()
-        time.sleep(1 / 30)
+    # Main loop. The teapot only changes when a key is pressed, so a new frame
+    # is only drawn after an event is received.
+    window.run(draw_frame, lazy=True)
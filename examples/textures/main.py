@@ -1,7 +1,6 @@
 """ Use `pyg` to load and display Wavefront objects with textures.
 """
 
-import time
 from timeit import default_timer as timer
 
 import pyg
@@ -11,6 +10,14 @@ CAMERA_MOV_SPEED = 25
 MOUSE_SENSITIVITY = 0.2
 SCROLL_SENSITIVITY = 2
 
+# Directions in which the camera moves when each key is pressed.
+KEY_DIRECTIONS = {
+    pyg.Key.W: "forward",
+    pyg.Key.S: "backward",
+    pyg.Key.A: "left",
+    pyg.Key.D: "right",
+}
+
 
 if __name__ == "__main__":
     # Create and show a new window.
@@ -44,6 +51,9 @@ if __name__ == "__main__":
     # Point in time in which the last frame was rendered.
     last_render = timer()
 
+    # Time elapsed between the last two frames, measured once per frame.
+    frame_dT = 0.0
+
     # Last recorded position of the mouse's cursor.
     last_cursor_pos = (None, None)
 
@@ -55,16 +65,9 @@ if __name__ == "__main__":
         if action not in (pyg.KeyboardAction.PRESS, pyg.KeyboardAction.REPEAT):
             return
 
-        try:
-            direction = {
-                pyg.Key.W: "forward",
-                pyg.Key.S: "backward",
-                pyg.Key.A: "left",
-                pyg.Key.D: "right",
-            }[key]
-            window.camera.move(direction, dT=timer() - last_render)
-        except KeyError:
-            pass
+        direction = KEY_DIRECTIONS.get(key)
+        if direction is not None:
+            window.camera.move(direction, dT=frame_dT)
 
     # Callback to handle changes in the cursor's position.
     def handle_cursor_pos_event(x_pos: float, y_pos: float) -> None:
@@ -90,6 +93,10 @@ if __name__ == "__main__":
 
     # Main loop.
     while not window.should_close():
+        frame_time = timer()
+        frame_dT = frame_time - last_render
+        last_render = frame_time
+
         # Clear the window.
         window.clear(color=(1, 1, 1, 1))
 
@@ -101,5 +108,3 @@ if __name__ == "__main__":
         # Poll for events and update the window.
         window.poll_events()
         window.update()
-        time.sleep(1 / 30)
-        last_render = timer()
@@ -1,7 +1,31 @@
 """ Starts `glfw` and defines the library's API.
 """
 
+import os
+import warnings
+
 import glfw
+import OpenGL
+
+#: Whether pyg runs in debug mode, enabled by setting the `PYG_DEBUG`
+#: environment variable (to anything but "0") before importing the library.
+DEBUG = os.environ.get("PYG_DEBUG", "0") != "0"
+
+# Disable PyOpenGL's checks around every OpenGL call (mainly a `glGetError()`
+# after each call), which dominate the cost of drawing many small objects. They
+# are kept in debug mode, so errors are raised by the calls that cause them.
+# These must be set before `OpenGL.GL` is first imported.
+OpenGL.ERROR_CHECKING = DEBUG
+OpenGL.ERROR_LOGGING = DEBUG
+OpenGL.ARRAY_SIZE_CHECKING = DEBUG
+
+# Without PyOpenGL-accelerate (or with an older version of it than PyOpenGL's),
+# the arguments of every OpenGL call are converted in Python.
+# pylint: disable=[C0413]
+from OpenGL import acceleratesupport
+if not acceleratesupport.ACCELERATE_AVAILABLE:
+    warnings.warn("PyOpenGL-accelerate isn't available (or doesn't match "
+                  "PyOpenGL's version), so OpenGL calls will be slower.")
 
 # Start GLFW.
 glfw.init()
@@ -14,6 +38,8 @@ glfw.window_hint(glfw.OPENGL_PROFILE, glfw.OPENGL_CORE_PROFILE)
 # API.
 # pylint: disable=[C0413]
 from pyg.window import Window
+from pyg.transformation_handler import TransformationHandler
+from pyg.texture_atlas import TextureAtlas
 from pyg.enums.events import Key, KeyboardAction
 from pyg.enums.fill_mode import FillMode
 from pyg.enums.primitive_shape import PrimitiveShape
@@ -4,19 +4,54 @@
 from __future__ import annotations
 
 import abc
+import math
 from typing import Literal, Optional, TYPE_CHECKING
+from collections.abc import Iterable
 
 import numpy as np
 import glm
 
+from pyg.utils import boxes_in_frustum
+
 if TYPE_CHECKING:
     from pyg.window import Window
     from pyg.utils import Coord3D
+    from pyg.objects import GraphicObject
+
+
+#: Factor that converts degrees to radians.
+_DEG2RAD = math.pi / 180
+
+
+def _sincos_deg(angle: float) -> tuple[float, float]:
+    """ Returns the sine and the cosine of an angle given in degrees. """
+    rad = angle * _DEG2RAD
+    return math.sin(rad), math.cos(rad)
 
 
 class Camera(abc.ABC):
     """ Abstract class representing a camera. """
 
+    __slots__ = (
+        "_window",
+        "_pos",
+        "_world_up",
+        "_front",
+        "_yaw",
+        "_pitch",
+        "movement_speed",
+        "mouse_sensitivity",
+        "_fov",
+        "_right",
+        "_up",
+        "_bounds",
+        "_vectors_angles",
+        "_view_matrix",
+        "_view_key",
+        "_projection_matrix",
+        "_projection_key",
+    )
+
     def __init__(self,
                  pos: Coord3D = (0, 0, 2.5),
                  up: Coord3D = (0, 1, 0),
@@ -38,37 +73,137 @@ class Camera(abc.ABC):
         self._fov = zoom
         self._right = glm.vec3(0, 0, 0)
         self._up = glm.vec3(0, 0, 0)
+        self._bounds: Optional[tuple[glm.vec3, glm.vec3]] = None
+        self._vectors_angles: Optional[tuple[float, float]] = None
+        self._view_matrix = np.eye(4)
+        self._view_key: Optional[tuple[float, ...]] = None
+        self._projection_matrix = np.eye(4)
+        self._projection_key: Optional[tuple[float, ...]] = None
         self._update_vectors()
 
     @property
     def view_matrix(self) -> np.ndarray:
-        return np.array(
-            glm.lookAt(
-                self._pos,                # eye
-                self._pos + self._front,  # center
-                self._up,                 # up
-            ),
-        )
+        """ The camera's view matrix.
+
+        The matrix is cached and only rebuilt after the camera's position or
+        orientation change. The returned array is read-only.
+        """
+        key = (*self._pos, *self._front, *self._up)
+        if key != self._view_key:
+            self._view_matrix = np.array(
+                glm.lookAt(
+                    self._pos,                # eye
+                    self._pos + self._front,  # center
+                    self._up,                 # up
+                ),
+                dtype=np.float32,
+            )
+            self._view_matrix.flags.writeable = False
+            self._view_key = key
+        return self._view_matrix
 
     @property
     def projection_matrix(self) -> np.ndarray:
+        """ The camera's projection matrix.
+
+        The matrix is cached and only rebuilt after the camera's field of view
+        or the window's aspect ratio change. The returned array is read-only.
+        """
         if self._window is None:
             raise RuntimeError(
                 "Attempt to build a projection matrix in a camera with no "
                 "window!"
             )
-        return np.array(
-            glm.perspective(
-                glm.radians(self._fov),
-                self._window.size[0] / self._window.size[1],
-                0.1,
-                100,
-            ),
+
+        width, height = self._window.size
+        key = (self._fov, width, height)
+        if key != self._projection_key:
+            self._projection_matrix = np.array(
+                glm.perspective(
+                    self._fov * _DEG2RAD,
+                    width / height,
+                    0.1,
+                    100,
+                ),
+                dtype=np.float32,
+            )
+            self._projection_matrix.flags.writeable = False
+            self._projection_key = key
+        return self._projection_matrix
+
+    @property
+    def frustum_planes(self) -> np.ndarray:
+        """ NumPy array with shape `(6, 4)` containing the coefficients
+        `(a, b, c, d)` of the planes delimiting the camera's view frustum, in
+        world coordinates.
+
+        The planes are extracted from the rows of the combined projection and
+        view matrices (Gribb-Hartmann method). Their normals point to the
+        inside of the frustum, so a point `p` is inside it when
+        `a*p.x + b*p.y + c*p.z + d >= 0` for all the planes.
+        """
+        clip = self.projection_matrix @ self.view_matrix
+        return np.array([
+            clip[3] + clip[0],  # left
+            clip[3] - clip[0],  # right
+            clip[3] + clip[1],  # bottom
+            clip[3] - clip[1],  # top
+            clip[3] + clip[2],  # near
+            clip[3] - clip[2],  # far
+        ])
+
+    def cull(self, objects: Iterable[GraphicObject]) -> list[GraphicObject]:
+        """ Filters out the objects that are outside the camera's view.
+
+        Each object's bounding box (see :attr:`GraphicObject.bounding_box`) is
+        tested against the camera's view frustum. The test is conservative: all
+        visible objects are returned, but so might a few invisible ones.
+
+        Args:
+            objects: The objects to be tested.
+
+        Returns:
+            A list with the objects that might be visible, in their original
+            order.
+        """
+        objects = list(objects)
+        if not objects:
+            return objects
+
+        boxes = [obj.bounding_box for obj in objects]
+        visible = boxes_in_frustum(
+            self.frustum_planes,
+            np.array([b[0] for b in boxes]),
+            np.array([b[1] for b in boxes]),
         )
+        return [obj for obj, v in zip(objects, visible) if v]
 
     def set_window(self, new_window: Window) -> None:
         self._window = new_window
 
+    def set_bounds(self,
+                   lower: Optional[Coord3D],
+                   upper: Optional[Coord3D]) -> None:
+        """ Limits the region of the world in which the camera can move.
+
+        Args:
+            lower: The minimum x, y and z coordinates of the camera's position.
+            upper: The maximum x, y and z coordinates of the camera's position.
+                If either bound is `None`, the camera's movement isn't limited.
+        """
+        if lower is None or upper is None:
+            self._bounds = None
+        else:
+            self._bounds = (glm.vec3(*lower), glm.vec3(*upper))
+            self._clamp_pos()
+
+    def _clamp_pos(self) -> None:
+        """ Moves the camera's position back into its bounds, if it has any.
+        Should be called by subclasses after moving the camera.
+        """
+        if self._bounds is not None:
+            self._pos = glm.clamp(self._pos, *self._bounds)
+
     @abc.abstractmethod
     def move(self,
              direction: Literal["forward", "backward", "left", "right"],
@@ -87,10 +222,29 @@ class Camera(abc.ABC):
         """ Zooms the camera. """
 
     def _update_vectors(self) -> None:
-        self._front = glm.normalize(glm.vec3(
-            glm.cos(glm.radians(self._yaw)) * glm.cos(glm.radians(self._pitch)),
-            glm.sin(glm.radians(self._pitch)),
-            glm.sin(glm.radians(self._yaw)) * glm.cos(glm.radians(self._pitch)),
-        ))
-        self._right = glm.normalize(glm.cross(self._front, self._world_up))
-        self._up = glm.normalize(glm.cross(self._right, self._front))
+        # The vectors only depend on the camera's yaw and pitch.
+        angles = (self._yaw, self._pitch)
+        if angles == self._vectors_angles:
+            return
+        self._vectors_angles = angles
+
+        sin_yaw, cos_yaw = _sincos_deg(self._yaw)
+        sin_pitch, cos_pitch = _sincos_deg(self._pitch)
+
+        # The front vector is already normalized.
+        fx, fy, fz = cos_yaw * cos_pitch, sin_pitch, sin_yaw * cos_pitch
+        self._front = glm.vec3(fx, fy, fz)
+
+        if self._world_up != glm.vec3(0, 1, 0):
+            self._right = glm.normalize(glm.cross(self._front, self._world_up))
+            self._up = glm.normalize(glm.cross(self._right, self._front))
+            return
+
+        # With the y-axis as the world's up vector, normalizing
+        # `front x (0, 1, 0) = (-fz, 0, fx)` only removes `|cos(pitch)|`. The
+        # right and front vectors are orthonormal, so their cross product is
+        # already normalized.
+        sign = math.copysign(1.0, cos_pitch)
+        rx, rz = -sin_yaw * sign, cos_yaw * sign
+        self._right = glm.vec3(rx, 0, rz)
+        self._up = glm.vec3(-rz * fy, rz * fx - rx * fz, rx * fy)
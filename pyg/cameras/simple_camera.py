@@ -10,6 +10,8 @@ from .camera import Camera
 class SimpleCamera(Camera):
     """ A simple camera. """
 
+    __slots__ = ()
+
     def move(self,
              direction: Literal["forward", "backward", "left", "right"],
              dT: float) -> None:
@@ -24,6 +26,7 @@ class SimpleCamera(Camera):
             self._pos += self._right * vel
         else:
             raise ValueError(f"Invalid movement direction \"{direction}\".")
+        self._clamp_pos()
 
     def incline(self,
                 x_offset: float,
@@ -5,7 +5,7 @@ import numpy as np
 
 
 #: Default color to be used for drawing objects.
-DEFAULT_COLOR = np.array([1, 0.5, 0.2, 1])
+DEFAULT_COLOR = np.array([1, 0.5, 0.2, 1], dtype=np.float32)
 
 
 #: Default coordinates of a vertex.
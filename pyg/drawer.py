@@ -5,12 +5,18 @@
 from __future__ import annotations
 
 import ctypes
-from typing import TYPE_CHECKING, Final
+import weakref
+from typing import TYPE_CHECKING, Any, Final, Optional
+from collections.abc import Iterable
 
+import numpy as np
 import OpenGL.GL as gl  # noqa
 import OpenGL.GL.shaders  # pylint: disable=[W0611]
 
-from .objects import GraphicObject, Dot, Line, Triangle, Rectangle, Circle
+from .objects import (
+    GraphicObject, SimpleGraphicObject, MergedGraphicObject,
+    Dot, Line, Triangle, Rectangle, Circle,
+)
 
 if TYPE_CHECKING:
     from .window import Window
@@ -21,13 +27,19 @@ _VERTEX_SHADER_SRC: Final[str] = """
     #version 330 core
     
     attribute vec3 aPos;
+    attribute vec4 aColor;
     
     uniform mat4 model;
-    uniform mat4 view;
-    uniform mat4 projection;
+    layout (std140, row_major) uniform Camera {
+        mat4 view;
+        mat4 projection;
+    };
+    
+    out vec4 vertexColor;
 
     void main() {
         gl_Position = projection * view * model * vec4(aPos, 1.0);
+        vertexColor = aColor;
     }
 """
 
@@ -37,15 +49,20 @@ _VERTEX_SHADER_TEXTURE_SRC: Final[str] = """
 
     attribute vec3 aPos;
     attribute vec2 aTextureCoord;
+    attribute mat4 aInstanceModel;
     
     uniform mat4 model;
-    uniform mat4 view;
-    uniform mat4 projection;
+    layout (std140, row_major) uniform Camera {
+        mat4 view;
+        mat4 projection;
+    };
     
     out vec2 textureCoord;
 
     void main() {
-        gl_Position = projection * view * model * vec4(aPos, 1.0);
+        gl_Position = (
+            projection * view * model * aInstanceModel * vec4(aPos, 1.0)
+        );
         textureCoord = aTextureCoord;
     }
 """
@@ -54,10 +71,11 @@ _VERTEX_SHADER_TEXTURE_SRC: Final[str] = """
 _FRAGMENT_SHADER_SRC: Final[str] = """
     #version 330 core
     
+    in vec4 vertexColor;
     uniform vec4 color;
     
     void main() {
-        gl_FragColor = color;
+        gl_FragColor = color * vertexColor;
     } 
 """
 
@@ -74,23 +92,75 @@ _FRAGMENT_SHADER_TEXTURE_SRC: Final[str] = """
 """
 
 
+#: Initial size, in bytes, of the ring buffer used to stream vertices.
+_STREAM_BUFFER_SIZE: Final[int] = 4 * 1024 * 1024
+
+#: Binding point of the uniform block holding the camera's matrices.
+_CAMERA_BLOCK_BINDING: Final[int] = 0
+
+#: Shader programs already linked, per window, keyed by their shaders' source
+#: code. Programs belong to a window's GL context, so they are only reused by
+#: drawers of the same window.
+_PROGRAM_CACHE: Final[weakref.WeakKeyDictionary[Window, dict[tuple[str, str],
+                                                              Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _shader_program(window: Window, vertex_src: str, frag_src: str) -> Any:
+    """ Returns a shader program, linked in the given window's GL context, with
+    the given vertex and fragment shaders.
+
+    Compiling and linking shaders is slow, so the program is only built the
+    first time it's requested for a window. Must be called within the window's
+    GL context.
+    """
+    programs = _PROGRAM_CACHE.setdefault(window, {})
+    key = (vertex_src, frag_src)
+    if key not in programs:
+        programs[key] = gl.shaders.compileProgram(
+            gl.shaders.compileShader(vertex_src, gl.GL_VERTEX_SHADER),
+            gl.shaders.compileShader(frag_src, gl.GL_FRAGMENT_SHADER),
+        )
+    return programs[key]
+
+
+#: OpenGL state (bound objects, point size and line width) last set, per
+#: window, by a drawer. Only drawers set it, so setting it again to the same
+#: value can be skipped.
+_GL_STATE: Final[weakref.WeakKeyDictionary[Window, dict[str, Any]]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
 class Drawer:
-    """ Abstracts the drawing of basic shapes in a :class:`Window`. """
+    """ Abstracts the drawing of basic shapes in a :class:`Window`.
+
+    Drawing many small objects is bound by the CPU (Python and OpenGL calls),
+    not by arithmetic or by the GPU. The drawer therefore sets up everything
+    it can once: the vertex array object records the layout of the vertices,
+    vertices are streamed into a single buffer, and OpenGL state that is
+    already set isn't set again. Drawing more objects per call (see
+    :meth:`draw_many` and :meth:`begin_batch`) is what makes drawing faster.
+    """
 
     def __init__(self, window: Window, use_textures: bool = False) -> None:
         self._window = window
         self._use_textures = use_textures
+        self._batch: Optional[list[SimpleGraphicObject]] = None
 
         with self._window:
-            # Create buffers.
-            buffer = gl.glGenBuffers(2 if use_textures else 1)
-
             # Vertex buffer and array objects.
-            self._vbo = buffer[0] if use_textures else buffer
+            self._vbo = gl.glGenBuffers(1)
             self._vao = gl.glGenVertexArrays(1)
+            self._vbo_capacity = _STREAM_BUFFER_SIZE
+            self._vbo_head = 0
+            self._streamed_vertices: Optional[np.ndarray] = None
 
-            # Buffer for the coordinates of textures.
-            self._texture_buffer = buffer[1] if use_textures else None
+            # Buffers holding read-only vertices, keyed by the ids of their
+            # arrays, along with weak references to the arrays.
+            self._static_buffers: dict[int, tuple[weakref.ref[np.ndarray],
+                                                  Any]] = {}
 
             # Source code for the shaders.
             vertex_src, frag_src = (
@@ -98,98 +168,297 @@ class Drawer:
                 if use_textures else (_VERTEX_SHADER_SRC, _FRAGMENT_SHADER_SRC)
             )
 
-            # Compile the vertex shader.
-            self._vertex_shader = gl.shaders.compileShader(
-                vertex_src,
-                gl.GL_VERTEX_SHADER,
-            )
-
-            # Compile the fragment shader.
-            self._fragment_shader = gl.shaders.compileShader(
-                frag_src,
-                gl.GL_FRAGMENT_SHADER,
+            # Compile and link the shaders, or reuse the program already built
+            # for them in the window's GL context.
+            self._shader_program = _shader_program(window, vertex_src, frag_src)
+
+            # Look up the locations of the shader's attributes and uniforms
+            # once, since they don't change after the program is linked.
+            program = self._shader_program
+            self._pos_loc = gl.glGetAttribLocation(program, "aPos")
+            self._model_loc = gl.glGetUniformLocation(program, "model")
+
+            # The camera's matrices are kept in a uniform buffer, which is only
+            # updated when they change.
+            gl.glUniformBlockBinding(
+                program,
+                gl.glGetUniformBlockIndex(program, "Camera"),
+                _CAMERA_BLOCK_BINDING,
             )
+            self._camera_data = np.zeros((2, 4, 4), dtype=np.float32)
+            self._camera_matrices: tuple[Optional[np.ndarray],
+                                         Optional[np.ndarray]] = (None, None)
+            self._camera_ubo = gl.glGenBuffers(1)
+            gl.glBindBuffer(gl.GL_UNIFORM_BUFFER, self._camera_ubo)
+            gl.glBufferData(gl.GL_UNIFORM_BUFFER,
+                            self._camera_data.nbytes,
+                            None,
+                            gl.GL_DYNAMIC_DRAW)
+
+            # Allocate our vertex buffer and record the layout of the
+            # vertices' positions (tightly packed `vec3`s) in our vertex array
+            # object. When drawing, only the offset of the vertices changes.
+            gl.glBindVertexArray(self._vao)
+            _GL_STATE.setdefault(window, {})["vao"] = self._vao
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._vbo)
+            gl.glBufferData(gl.GL_ARRAY_BUFFER,
+                            self._vbo_capacity,
+                            None,
+                            gl.GL_STREAM_DRAW)
+            gl.glEnableVertexAttribArray(self._pos_loc)
+            gl.glVertexAttribPointer(self._pos_loc,
+                                     3,
+                                     gl.GL_FLOAT,
+                                     False,
+                                     3 * 4,
+                                     ctypes.c_void_p(0))
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
 
-            # Start a shader program.
-            self._shader_program = gl.shaders.compileProgram(
-                self._vertex_shader,
-                self._fragment_shader,
-            )
+            # Locations passed to the objects' `draw()` methods.
+            self._draw_locations: dict[str, Any]
+            if use_textures:
+                self._draw_locations = {
+                    "texture_coord_loc": gl.glGetAttribLocation(
+                        program, "aTextureCoord",
+                    ),
+                    "instance_model_loc": gl.glGetAttribLocation(
+                        program, "aInstanceModel",
+                    ),
+                }
+            else:
+                self._draw_locations = {
+                    "color_loc": gl.glGetUniformLocation(program, "color"),
+                    "vertex_color_loc": gl.glGetAttribLocation(program,
+                                                               "aColor"),
+                }
+
+            # When an object isn't instanced, the per-instance model matrix
+            # must be an identity matrix. This is the value the attribute
+            # holds while its arrays are disabled.
+            if use_textures:
+                instance_model_loc = self._draw_locations["instance_model_loc"]
+                for i in range(4):
+                    gl.glVertexAttrib4f(
+                        instance_model_loc + i,
+                        *(1.0 if i == j else 0.0 for j in range(4)),
+                    )
+
+            # Similarly, the color of objects without per-vertex colors (given
+            # by the `color` uniform) must be multiplied by white.
+            if not use_textures:
+                gl.glVertexAttrib4f(
+                    self._draw_locations["vertex_color_loc"],
+                    1.0, 1.0, 1.0, 1.0,
+                )
 
     def __call__(self, obj: GraphicObject) -> None:
-        """ Draws a graphic object in the drawer's window. """
-        with self._window:
-            # Activate the shader program.
-            gl.glUseProgram(self._shader_program)
+        """ Draws a graphic object in the drawer's window.
 
-            # Bind our vertex array object.
-            gl.glBindVertexArray(self._vao)
-
-            # Bind our vertex buffer and set its data (send our data to the
-            # GPU).
-            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._vbo)
-            gl.glBufferData(
-                gl.GL_ARRAY_BUFFER,
-                obj.vertices.nbytes,
-                obj.vertices,
-                gl.GL_DYNAMIC_DRAW,
-            )
-
-            # Set our vertex attributes pointers. We're telling OpenGL how it
-            # should interpret the vertex data.
-            pos_attr_loc = gl.glGetAttribLocation(self._shader_program, "aPos")
-            gl.glEnableVertexAttribArray(pos_attr_loc)
-            gl.glVertexAttribPointer(
-                pos_attr_loc,
-                3,
-                gl.GL_FLOAT,
-                False,
-                obj.vertices.strides[0],
-                ctypes.c_void_p(0),
-            )
+        If a batch was started (see :meth:`begin_batch`), simple graphic objects
+        are only drawn when the batch ends.
+        """
+        if self._batch is not None:
+            if isinstance(obj, SimpleGraphicObject) and not self._use_textures:
+                self._batch.append(obj)
+                return
+
+            # Keep the drawing order: the batched objects are drawn first.
+            self._flush_batch()
+        self.draw_many((obj,))
+
+    def reset_state(self) -> None:
+        """ Forgets the OpenGL state (bound objects, point size and line width)
+        the drawers of this drawer's window last set.
+
+        Drawers skip setting state that is already set, so this must be called
+        after other code changes that state (e.g. binds its own shader program)
+        in the window's GL context. The next draw then sets it all again.
+        """
+        _GL_STATE.pop(self._window, None)
 
-            # Set the object's model matrix.
-            gl.glUniformMatrix4fv(
-                gl.glGetUniformLocation(self._shader_program, "model"),
-                1,
-                gl.GL_TRUE,
-                obj.model_matrix,
-            )
+    def begin_batch(self) -> None:
+        """ Starts batching the objects drawn by the drawer.
 
-            # Set the window's view matrix.
-            gl.glUniformMatrix4fv(
-                gl.glGetUniformLocation(self._shader_program, "view"),
-                1,
-                gl.GL_TRUE,
-                self._window.camera.view_matrix,
-            )
+        Until :meth:`end_batch` is called, the simple graphic objects drawn
+        with the drawer (including the shapes drawn by methods like
+        :meth:`circle` and :meth:`rect`) are collected instead of drawn. They
+        are then merged (see :class:`MergedGraphicObject`) and drawn with a
+        few draw calls. As with merged objects, the size of points and the
+        width of lines are not preserved.
+        """
+        assert self._batch is None, "A batch has already been started!"
+        self._batch = []
 
-            # Set the window's projection matrix.
-            gl.glUniformMatrix4fv(
-                gl.glGetUniformLocation(self._shader_program, "projection"),
-                1,
-                gl.GL_TRUE,
-                self._window.camera.projection_matrix,
-            )
+    def end_batch(self) -> None:
+        """ Draws the objects collected since :meth:`begin_batch` was called
+        and stops batching.
+        """
+        assert self._batch is not None, "No batch has been started!"
+        self._flush_batch()
+        self._batch = None
+
+    def _flush_batch(self) -> None:
+        """ Draws and clears the objects collected in the current batch. """
+        if not self._batch:
+            return
+
+        merged = MergedGraphicObject(self._batch)
+        self._batch = []
+        self.draw_many((merged,))
+        with self._window:
+            merged.delete()
 
-            # Draw.
-            if self._use_textures:
-                gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._texture_buffer)
-                obj.draw(
-                    texture_coord_loc=gl.glGetAttribLocation(
-                        self._shader_program, "aTextureCoord",
-                    ),
-                )
-            else:
-                obj.draw(
-                    color_loc=gl.glGetUniformLocation(
-                        self._shader_program, "color",
-                    ),
-                )
+    def draw_many(self, objects: Iterable[GraphicObject]) -> None:
+        """ Draws many graphic objects in the drawer's window, in order.
 
-            # Clean up.
-            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, 0)
-            gl.glUseProgram(0)
+        Equivalent to calling the drawer on each object, but the state shared
+        by all the objects (the shader program, the vertex array object and the
+        camera's matrices) is only set up once.
+        """
+        with self._window:
+            # Activate the shader program and bind our vertex array object,
+            # unless they are still bound from the previous draw.
+            state = _GL_STATE.setdefault(self._window, {})
+            if state.get("program") != self._shader_program:
+                gl.glUseProgram(self._shader_program)
+                state["program"] = self._shader_program
+            if state.get("vao") != self._vao:
+                gl.glBindVertexArray(self._vao)
+                state["vao"] = self._vao
+
+            # Bind the camera's uniform buffer and send the camera's matrices
+            # to it, if they have changed since our last draw. The camera's
+            # matrices are cached, so unchanged matrices are the same arrays.
+            if state.get("camera_ubo") != self._camera_ubo:
+                gl.glBindBufferBase(gl.GL_UNIFORM_BUFFER,
+                                    _CAMERA_BLOCK_BINDING,
+                                    self._camera_ubo)
+                state["camera_ubo"] = self._camera_ubo
+            camera = self._window.camera
+            matrices = (camera.view_matrix, camera.projection_matrix)
+            if any(new is not old
+                   for new, old in zip(matrices, self._camera_matrices)):
+                self._camera_data[0], self._camera_data[1] = matrices
+                gl.glBindBuffer(gl.GL_UNIFORM_BUFFER, self._camera_ubo)
+                gl.glBufferSubData(gl.GL_UNIFORM_BUFFER,
+                                   0,
+                                   self._camera_data.nbytes,
+                                   self._camera_data)
+                self._camera_matrices = matrices
+
+            for obj in objects:
+                # Send the object's vertices to the GPU.
+                gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._vbo)
+                self._stream_vertices(obj.vertices)
+
+                # Set the object's model matrix.
+                gl.glUniformMatrix4fv(self._model_loc,
+                                      1,
+                                      gl.GL_TRUE,
+                                      obj.model_matrix)
+
+                # Set the size of points and the width of lines, if they have
+                # changed.
+                if (isinstance(obj, Dot)
+                        and state.get("point_size") != obj.size):
+                    gl.glPointSize(obj.size)
+                    state["point_size"] = obj.size
+                elif (isinstance(obj, Line)
+                        and state.get("line_width") != obj.line_width):
+                    gl.glLineWidth(obj.line_width)
+                    state["line_width"] = obj.line_width
+
+                # Draw.
+                obj.draw(**self._draw_locations)
+
+    def _stream_vertices(self, vertices: np.ndarray) -> None:
+        """ Writes vertices to the next free region of the vertex buffer (a
+        ring buffer), which must be bound, and points the `aPos` attribute to
+        them.
+
+        The regions are mapped unsynchronized, so writing to them never waits
+        for the GPU. That is safe because regions are never reused until the
+        buffer wraps around, at which point its storage is orphaned (the
+        driver allocates new storage while previous draws still read the old
+        one). Read-only vertices are kept in buffers of their own instead (see
+        :meth:`_bind_static_vertices`).
+        """
+        # Read-only vertices can't change, so, if they were the last ones
+        # drawn, the attribute still points to them.
+        if vertices is self._streamed_vertices:
+            return
+
+        nbytes = vertices.nbytes
+        if nbytes == 0:
+            return
+
+        if not vertices.flags.writeable:
+            self._bind_static_vertices(vertices)
+            self._streamed_vertices = vertices
+            return
+
+        if nbytes > self._vbo_capacity:
+            self._vbo_capacity = max(nbytes, 2 * self._vbo_capacity)
+            self._vbo_head = self._vbo_capacity
+        if self._vbo_head + nbytes > self._vbo_capacity:
+            gl.glBufferData(gl.GL_ARRAY_BUFFER,
+                            self._vbo_capacity,
+                            None,
+                            gl.GL_STREAM_DRAW)
+            self._vbo_head = 0
+
+        ptr = gl.glMapBufferRange(gl.GL_ARRAY_BUFFER,
+                                  self._vbo_head,
+                                  nbytes,
+                                  gl.GL_MAP_WRITE_BIT
+                                  | gl.GL_MAP_INVALIDATE_RANGE_BIT
+                                  | gl.GL_MAP_UNSYNCHRONIZED_BIT)
+        ctypes.memmove(ptr, np.ascontiguousarray(vertices).ctypes.data, nbytes)
+        gl.glUnmapBuffer(gl.GL_ARRAY_BUFFER)
+
+        gl.glVertexAttribPointer(self._pos_loc,
+                                 3,
+                                 gl.GL_FLOAT,
+                                 False,
+                                 3 * 4,
+                                 ctypes.c_void_p(self._vbo_head))
+        self._vbo_head += nbytes
+        self._streamed_vertices = None
+
+    def _bind_static_vertices(self, vertices: np.ndarray) -> None:
+        """ Points the `aPos` attribute to a buffer holding the given
+        read-only vertices.
+
+        Read-only vertices (such as those of merged objects, see
+        :func:`pyg.objects.batching.bake`) can't change, so they are sent to
+        the GPU only once, to a buffer of their own, instead of being streamed
+        on every draw. The buffers of arrays that no longer exist are deleted
+        when a new buffer is created.
+        """
+        entry = self._static_buffers.get(id(vertices))
+        if entry is not None and entry[0]() is vertices:
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, entry[1])
+        else:
+            dead = [key for key, (ref, _) in self._static_buffers.items()
+                    if ref() is None]
+            if dead:
+                gl.glDeleteBuffers(len(dead), [self._static_buffers.pop(key)[1]
+                                               for key in dead])
+
+            buffer = gl.glGenBuffers(1)
+            self._static_buffers[id(vertices)] = (weakref.ref(vertices), buffer)
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, buffer)
+            gl.glBufferData(gl.GL_ARRAY_BUFFER,
+                            vertices.nbytes,
+                            np.ascontiguousarray(vertices),
+                            gl.GL_STATIC_DRAW)
+
+        gl.glVertexAttribPointer(self._pos_loc,
+                                 3,
+                                 gl.GL_FLOAT,
+                                 False,
+                                 3 * 4,
+                                 ctypes.c_void_p(0))
 
     def dot(self, *args, **kwargs) -> None:
         """ Draws a dot at the given position.
@@ -4,9 +4,11 @@
 from .graphic_object import GraphicObject
 from .simple_graphic_object import SimpleGraphicObject
 from .texturized_object import TexturizedGraphicObject
+from .instanced_texturized_object import InstancedTexturizedGraphicObject
 from .dot import Dot
 from .line import Line
 from .triangle import Triangle
 from .rectangle import Rectangle
 from .circle import Circle
 from .cube import Cube
+from .merged_graphic_object import MergedGraphicObject
@@ -0,0 +1,142 @@
+""" Implements the merging (baking) of static graphic objects into batches that
+can be drawn with fewer draw calls.
+"""
+
+from __future__ import annotations
+
+from typing import Final, Optional
+from collections.abc import Iterable
+
+import numpy as np
+
+from pyg.enums.primitive_shape import PrimitiveShape
+from .graphic_object import GraphicObject
+from .texturized_object import TexturizedGraphicObject
+from .instanced_texturized_object import InstancedTexturizedGraphicObject
+
+
+#: Primitives whose vertex streams can be merged.
+_MERGEABLE_PRIMITIVES: Final[frozenset[PrimitiveShape]] = frozenset({
+    PrimitiveShape.POINTS,
+    PrimitiveShape.LINES,
+    PrimitiveShape.TRIANGLES,
+    PrimitiveShape.TRIANGLE_STRIP,
+})
+
+#: Primitives whose vertex streams can simply be concatenated.
+_LIST_PRIMITIVES: Final[frozenset[PrimitiveShape]] = frozenset({
+    PrimitiveShape.POINTS,
+    PrimitiveShape.LINES,
+    PrimitiveShape.TRIANGLES,
+})
+
+
+def _world_vertices(vertices: np.ndarray, model: np.ndarray) -> np.ndarray:
+    """ Applies a model matrix to the given vertices. """
+    return vertices @ model[:3, :3].T + model[:3, 3]
+
+
+def _join(arrays: list[np.ndarray], primitive: PrimitiveShape) -> np.ndarray:
+    """ Joins the vertex streams (or their per-vertex data) of objects drawn
+    with the given primitive.
+
+    Triangle strips are joined by repeating the last vertex of a strip and the
+    first vertex of the next one, which creates degenerate (invisible)
+    triangles between them. An extra vertex is repeated when needed to keep
+    the winding order of the next strip.
+    """
+    if primitive in _LIST_PRIMITIVES:
+        return np.concatenate(arrays)
+
+    parts = [arrays[0]]
+    length = len(arrays[0])
+    for array in arrays[1:]:
+        bridge = [parts[-1][-1:]] * (1 if length % 2 == 0 else 2)
+        bridge.append(array[:1])
+        parts += bridge + [array]
+        length += len(bridge) + len(array)
+    return np.concatenate(parts)
+
+
+def bake(objects: Iterable[GraphicObject],
+         cell_size: Optional[float] = None) -> list[GraphicObject]:
+    """ Merges static texturized objects into as few objects as possible.
+
+    Objects sharing the same texture and primitive are merged into a single
+    :class:`TexturizedGraphicObject`, whose vertices are already transformed
+    to world coordinates (its model matrix is the identity). Objects that can't
+    be merged (non-texturized objects or objects using line strips, loops or
+    fans) and instanced objects, which are already drawn with a single draw
+    call, are returned unchanged.
+
+    A merged object is culled (see :meth:`pyg.cameras.Camera.cull`) as a
+    whole, using a bounding box that encloses all of its objects. Merging the
+    objects of a whole scene would leave a few boxes spanning most of it, which
+    are never outside the camera's view. If a cell size is given, the space is
+    divided into a grid of cubic cells and only objects whose bounding boxes
+    have their centers in the same cell are merged, so the merged objects keep
+    boxes that are about as small as the cells.
+
+    Each merged object takes the place, in the returned list, of the first of
+    its objects, and the objects that weren't merged keep their relative
+    order. The merged objects' later members are thus drawn earlier than they
+    would have been, which only matters for overlapping (e.g. translucent)
+    objects drawn without depth testing.
+
+    Since the transformations are baked into the vertices, changes made to the
+    original objects after this function is called aren't reflected in the
+    returned objects. The merged vertices are read-only, so the drawer sends
+    them to the GPU only once (see :class:`pyg.drawer.Drawer`).
+
+    Args:
+        objects: The objects to be merged.
+        cell_size: Optional length of the edges of the grid's cells, in world
+            units. If not provided, objects are merged regardless of their
+            positions.
+
+    Returns:
+        A list with the merged objects and the objects that couldn't be
+        merged.
+    """
+    assert cell_size is None or cell_size > 0
+    result: list[GraphicObject] = []
+    groups: dict[tuple[int, PrimitiveShape, tuple[int, ...]],
+                 tuple[int, list[TexturizedGraphicObject]]] = {}
+    for obj in objects:
+        if (not isinstance(obj, TexturizedGraphicObject)
+                or isinstance(obj, InstancedTexturizedGraphicObject)
+                or obj.primitive not in _MERGEABLE_PRIMITIVES
+                or len(obj.vertices) == 0):
+            result.append(obj)
+            continue
+
+        cell: tuple[int, ...] = ()
+        if cell_size is not None:
+            lower, upper = obj.bounding_box
+            cell = tuple(np.floor((lower + upper) / (2 * cell_size))
+                         .astype(int).tolist())
+
+        # The group's first member holds its place in the result until the
+        # group is merged.
+        key = (obj.texture.gl_id, obj.primitive, cell)
+        if key not in groups:
+            groups[key] = (len(result), [])
+            result.append(obj)
+        groups[key][1].append(obj)
+
+    for (_, primitive, _), (index, group) in groups.items():
+        if len(group) == 1:
+            continue
+
+        vertices = _join([_world_vertices(obj.vertices, obj.model_matrix)
+                          for obj in group], primitive).astype(np.float32)
+        vertices.flags.writeable = False
+        coordinates = _join([obj.texture.coordinates for obj in group],
+                            primitive)
+        result[index] = TexturizedGraphicObject(
+            vertices=vertices,
+            texture=group[0].texture.with_coordinates(coordinates),
+            primitive=primitive,
+        )
+
+    return result
@@ -2,6 +2,8 @@
 """
 
 from __future__ import annotations
+
+import functools
 from typing import Optional
 
 import numpy as np
@@ -12,8 +14,38 @@ from pyg.enums.fill_mode import FillMode
 from pyg.utils import Coord2D, Coord3D, Color
 
 
+@functools.lru_cache(maxsize=None)
+def _unit_circle(quality_level: int) -> np.ndarray:
+    """ Computes `quality_level` evenly spaced points (with z = 0) on the unit
+    circle.
+
+    The results are cached, since they only depend on the quality level. The
+    returned array is read-only, so it can be shared by many circles.
+    """
+    angles = np.arange(quality_level) * (2 * np.pi / quality_level)
+    points = np.zeros((quality_level, 3), dtype=np.float32)
+    points[:, 0] = np.cos(angles)
+    points[:, 1] = np.sin(angles)
+    points.flags.writeable = False
+    return points
+
+
 class Circle(SimpleGraphicObject):
-    """ Graphic object representing a circle. """
+    """ Graphic object representing a circle.
+
+    Circles with the same quality level share the same (read-only) vertices,
+    those of a unit circle, which are scaled and moved into place by the
+    circle's initial model matrix. This way, the drawer doesn't need to send
+    the vertices of consecutive circles to the GPU again.
+
+    Note:
+        Since the circle's center and radius are part of its model matrix,
+        :attr:`vertices` returns the unit circle's vertices, not the circle's.
+        A matrix assigned to `transform.matrix` replaces the placement, so it
+        must include it (transformations like `transform.translate()` are
+        still applied on top of it). Calling `transform.reset()` moves the
+        circle back to its initial placement.
+    """
 
     def __init__(self,
                  center_pos: Coord2D | Coord3D | np.ndarray,
@@ -32,26 +64,16 @@ class Circle(SimpleGraphicObject):
             quality_level: An integer related to the quality of the drawn
                 circle. Greater values mean higher quality.
         """
-        vertices = []
-        inc = 2 * np.pi / quality_level
-        for i in range(quality_level):
-            angle = i * inc
-            x = np.cos(angle) * radius + center_pos[0]
-            y = np.sin(angle) * radius + center_pos[1]
-            vertices.append((x, y))
-
-        vertices = np.array(vertices, dtype=np.float32)
-        if len(center_pos) == 3:
-            vertices = np.hstack([
-                vertices,
-                np.full([vertices.shape[0], 1],
-                        center_pos[-1],
-                        dtype=np.float32),
-            ])
+        # Scale and move the unit circle into place.
+        center = np.asarray(center_pos, dtype=np.float32)
+        initial_model = np.eye(4, dtype=np.float32)
+        initial_model[[0, 1], [0, 1]] = radius
+        initial_model[:len(center), 3] = center
 
         super().__init__(
-            vertices=vertices,
+            vertices=_unit_circle(quality_level),
             primitive=PrimitiveShape.TRIANGLE_FAN,
             color=color,
+            initial_model=initial_model,
             fill_mode=fill_mode,
         )
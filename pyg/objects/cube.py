@@ -3,7 +3,10 @@
 
 
 from __future__ import annotations
-from typing import Optional, Any
+
+import ctypes
+import weakref
+from typing import TYPE_CHECKING, Final, Optional, Any
 
 import numpy as np
 import OpenGL.GL as gl  # noqa
@@ -13,6 +16,45 @@ from pyg.enums.primitive_shape import PrimitiveShape
 from pyg.enums.fill_mode import FillMode
 from pyg.utils import Color, Colored
 
+if TYPE_CHECKING:
+    from pyg.window import Window
+
+
+#: Indices of the vertices of the cube's 12 triangles. Each face is made of 4
+#: vertices (laid out as a triangle strip), split into 2 triangles.
+_CUBE_INDICES: Final[np.ndarray] = (
+    np.arange(0, 24, 4, dtype=np.uint8)[:, np.newaxis]
+    + np.array([0, 1, 2, 2, 1, 3], dtype=np.uint8)
+).ravel()
+
+#: Buffers holding `_CUBE_INDICES`, per window. Buffers belong to a window's GL
+#: context, so all the cubes drawn in the same window share one buffer, which is
+#: released together with the window.
+_INDEX_BUFFERS: Final[weakref.WeakKeyDictionary[Window, Any]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def _bind_index_buffer() -> None:
+    """ Binds the buffer holding the cube's indices in the current window's GL
+    context, creating it (and sending the indices to the GPU) the first time
+    it's requested for the window.
+    """
+    # pylint: disable=C0415,W0212
+    from pyg.window import Window
+    window = Window._current
+    assert window is not None
+    buffer = _INDEX_BUFFERS.get(window)
+    if buffer is None:
+        buffer = _INDEX_BUFFERS[window] = gl.glGenBuffers(1)
+        gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, buffer)
+        gl.glBufferData(gl.GL_ELEMENT_ARRAY_BUFFER,
+                        _CUBE_INDICES.nbytes,
+                        _CUBE_INDICES,
+                        gl.GL_STATIC_DRAW)
+    else:
+        gl.glBindBuffer(gl.GL_ELEMENT_ARRAY_BUFFER, buffer)
+
 
 class Cube(GraphicObject, Colored):
     """ Simple cube.obj. """
@@ -25,6 +67,11 @@ class Cube(GraphicObject, Colored):
         self.color = color
         self.diff_faces_colors = diff_faces_colors
         self.fill_mode = fill_mode
+        self._vertex_colors: Optional[np.ndarray] = None
+        self._vertex_colors_key: tuple[Optional[np.ndarray], bool] = (None,
+                                                                       False)
+        self._uploaded_colors: Optional[np.ndarray] = None
+        self._color_vbo: Optional[Any] = None
         super().__init__(
             initial_model=initial_model,
             vertices=[
@@ -68,13 +115,76 @@ class Cube(GraphicObject, Colored):
 
     def draw(self,
              color_loc: Optional[Any] = None,
-             texture_coord_loc: Optional[Any] = None) -> None:
-        assert color_loc is not None
+             texture_coord_loc: Optional[Any] = None,
+             instance_model_loc: Optional[Any] = None,
+             vertex_color_loc: Optional[Any] = None) -> None:
+        assert color_loc is not None and vertex_color_loc is not None
+
+        # Send the vertices' colors to the GPU, if they have changed.
+        colors = self._get_vertex_colors()
+        if self._color_vbo is None:
+            self._color_vbo = gl.glGenBuffers(1)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._color_vbo)
+        if self._uploaded_colors is not colors:
+            gl.glBufferData(gl.GL_ARRAY_BUFFER,
+                            colors.nbytes,
+                            colors,
+                            gl.GL_DYNAMIC_DRAW)
+            self._uploaded_colors = colors
+        gl.glEnableVertexAttribArray(vertex_color_loc)
+        gl.glVertexAttribPointer(vertex_color_loc,
+                                 4,
+                                 gl.GL_FLOAT,
+                                 False,
+                                 4 * 4,
+                                 ctypes.c_void_p(0))
+
+        # The triangles' indices never change, so they are sent to the GPU only
+        # once per window.
+        _bind_index_buffer()
+
+        # Draw all the faces at once. The per-vertex colors are multiplied by
+        # the `color` uniform.
+        gl.glUniform4f(color_loc, 1.0, 1.0, 1.0, 1.0)
         gl.glPolygonMode(gl.GL_FRONT_AND_BACK, self.fill_mode.value)
-        for i in range(0, 24, 4):
-            color = (
-                ((24 - i) / 16) * self.color[:3]
-                if self.diff_faces_colors else self.color[:3]
-            )
-            gl.glUniform4f(color_loc, *color, self.color[-1])
-            gl.glDrawArrays(PrimitiveShape.TRIANGLE_STRIP.value, i, 4)
+        gl.glDrawElements(PrimitiveShape.TRIANGLES.value,
+                          len(_CUBE_INDICES),
+                          gl.GL_UNSIGNED_BYTE,
+                          ctypes.c_void_p(0))
+
+        # Restore the attribute's default value (white), so the objects drawn
+        # next aren't affected by these colors.
+        gl.glDisableVertexAttribArray(vertex_color_loc)
+        gl.glVertexAttrib4f(vertex_color_loc, 1.0, 1.0, 1.0, 1.0)
+
+    def delete(self) -> None:
+        """ Deletes the OpenGL buffer holding the cube's vertices' colors.
+
+        Should be called, within the GL context in which the cube was drawn,
+        when a short-lived cube won't be drawn again. If the cube is drawn
+        afterwards, the buffer is recreated.
+        """
+        if self._color_vbo is not None:
+            gl.glDeleteBuffers(1, [self._color_vbo])
+            self._color_vbo = None
+            self._uploaded_colors = None
+
+    def _get_vertex_colors(self) -> np.ndarray:
+        """ Returns a NumPy array with shape `(24, 4)` containing the colors of
+        the cube's vertices (the color of their face).
+
+        The colors are cached and only recomputed, in a new array, after the
+        cube's color (or `diff_faces_colors`) is set.
+        """
+        key = (self.color, self.diff_faces_colors)
+        if (self._vertex_colors is None
+                or key[0] is not self._vertex_colors_key[0]
+                or key[1] != self._vertex_colors_key[1]):
+            face_colors = np.tile(self.color, (6, 1)).astype(np.float32)
+            if self.diff_faces_colors:
+                face_colors[:, :3] *= (
+                    np.arange(24, 0, -4) / 16
+                )[:, np.newaxis]
+            self._vertex_colors = np.repeat(face_colors, 4, axis=0)
+            self._vertex_colors_key = key
+        return self._vertex_colors
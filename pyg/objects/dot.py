@@ -2,10 +2,9 @@
 """
 
 from __future__ import annotations
-from typing import Optional, Any
+from typing import Optional
 
 import numpy as np
-import OpenGL.GL as gl
 
 from pyg.objects.simple_graphic_object import SimpleGraphicObject
 from pyg.enums.fill_mode import FillMode
@@ -36,14 +35,16 @@ class Dot(SimpleGraphicObject):
         """
         self._size = size
         super().__init__(
-            vertices=[pos],
+            vertices=np.asarray(pos, dtype=np.float32)[np.newaxis],
             primitive=PrimitiveShape.POINTS,
             color=color,
             fill_mode=fill_mode,
         )
 
-    def draw(self,
-             color_loc: Optional[Any] = None,
-             texture_coord_loc: Optional[Any] = None) -> None:
-        gl.glPointSize(self._size)
-        super().draw(color_loc)
+    @property
+    def size(self) -> int:
+        """ The dot's size, in pixels.
+
+        It's set by the drawer before the object is drawn.
+        """
+        return self._size
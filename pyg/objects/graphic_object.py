@@ -10,7 +10,7 @@ from collections.abc import Sequence
 import numpy as np
 import OpenGL.GL as gl  # noqa
 
-from pyg.utils import Coord2D, Coord3D
+from pyg.utils import Coord2D, Coord3D, box_corners
 from pyg.transformation_handler import TransformationHandler
 
 
@@ -18,7 +18,7 @@ class GraphicObject(abc.ABC):
     """ Abstract class representing a generic drawable graphic object. """
 
     def __init__(self,
-                 vertices: Sequence[Coord2D] | Sequence[Coord3D],
+                 vertices: Sequence[Coord2D] | Sequence[Coord3D] | np.ndarray,
                  initial_model: Optional[np.ndarray] = None) -> None:
         """ Instantiates a new graphic object.
 
@@ -28,6 +28,8 @@ class GraphicObject(abc.ABC):
                 If provided, it must be a 4x4 NumPy array. If not provided, an
                 identity matrix is used.
         """
+        self._bounding_box: Optional[tuple[np.ndarray, np.ndarray]] = None
+        self._bounding_box_version = -1
         self.vertices = vertices  # type: ignore[assignment]
         self._transformation_handler = TransformationHandler(
             initial_matrix=initial_model,
@@ -37,6 +39,9 @@ class GraphicObject(abc.ABC):
     def vertices(self) -> np.ndarray:
         """ NumPy array of shape `(n, 3)` containing the raw/untransformed
         coordinates (x, y and z) of the object's `n` vertices.
+
+        The vertices are copied when set, unless they are given as a read-only
+        `float32` array, which is shared (it can't change).
         """
         return self._vertices
 
@@ -47,21 +52,36 @@ class GraphicObject(abc.ABC):
     ) -> None:
         """ Sets the coordinates of all the object's vertices. """
         # Convert the vertices to a NumPy array.
-        new_vertices = np.array(new_vertices, dtype=np.float32)
+        array = np.asarray(new_vertices, dtype=np.float32)
 
         # Check if the vertices have the correct shapes.
-        assert len(new_vertices.shape) == 2
-        assert new_vertices.shape[1] in (2, 3)
-
-        # Convert 2D vertices to 3D, if necessary.
-        if new_vertices.shape[1] == 2:
-            new_vertices = np.hstack([
-                new_vertices,
-                np.zeros((new_vertices.shape[0], 1), dtype=np.float32),
-            ])
-
-        # Update the current vertices.
-        self._vertices = new_vertices
+        assert len(array.shape) == 2
+        assert array.shape[1] in (2, 3)
+
+        # Copy the vertices (converting 2D vertices to 3D, if necessary), so
+        # they aren't shared with the caller. Read-only vertices can't change,
+        # so they are shared.
+        if array.shape[1] == 3 and not array.flags.writeable:
+            vertices = array
+        elif array.shape[1] == 2:
+            vertices = np.zeros((array.shape[0], 3), dtype=np.float32)
+            vertices[:, :2] = array
+        else:
+            vertices = array.copy()
+
+        # Update the current vertices. Their number is kept as an int, since
+        # it's read by every draw call.
+        self._vertices = vertices
+        self._num_vertices = len(vertices)
+
+        # Update the object's local bounding box.
+        if len(vertices) > 0:
+            self._local_bounding_box = (vertices.min(axis=0),
+                                        vertices.max(axis=0))
+        else:
+            self._local_bounding_box = (np.zeros(3, dtype=np.float32),
+                                        np.zeros(3, dtype=np.float32))
+        self._bounding_box = None
 
     @property
     def transform(self) -> TransformationHandler:
@@ -78,20 +98,46 @@ class GraphicObject(abc.ABC):
         """ The object's model matrix. """
         return self._transformation_handler.matrix
 
+    @property
+    def bounding_box(self) -> tuple[np.ndarray, np.ndarray]:
+        """ Axis-aligned bounding box (AABB) of the object in world coordinates.
+
+        The box is returned as a tuple with its minimum and maximum corners,
+        both NumPy arrays of shape `(3,)`. It's cached and only recomputed after
+        the object's vertices or model matrix change.
+        """
+        version = self._transformation_handler.version
+        if (self._bounding_box is None
+                or self._bounding_box_version != version):
+            self._bounding_box = self._compute_bounding_box()
+            self._bounding_box_version = version
+        return self._bounding_box
+
+    def _compute_bounding_box(self) -> tuple[np.ndarray, np.ndarray]:
+        """ Computes the object's world-space AABB by transforming the 8
+        corners of its local AABB with the object's model matrix.
+        """
+        corners = box_corners(*self._local_bounding_box)
+        world = corners @ self.model_matrix.T
+        return world[:, :3].min(axis=0), world[:, :3].max(axis=0)
+
     @abc.abstractmethod
     def draw(self,
              *,
              color_loc: Optional[Any] = None,
-             texture_coord_loc: Optional[Any] = None) -> None:
+             texture_coord_loc: Optional[Any] = None,
+             instance_model_loc: Optional[Any] = None,
+             vertex_color_loc: Optional[Any] = None) -> None:
         """ Draws the object in the current OpenGL window.
 
         When this method is called, the object's vertices must already be in the
         GPU. This method is responsible for specifying the object's color and
         its fill mode or its texture, as well as drawing its vertices.
 
-        If textures are being used, then, when this method is called, the
-        current bound OpenGL buffer can be safely used to store the coordinates
-        of the object's texture.
+        When this method is called, the currently bound OpenGL array buffer
+        holds the vertices of other objects. It must not be written to, but
+        other buffers (like the one holding the coordinates of the object's
+        texture) can be bound in its place.
 
         Args:
             color_loc: Location of the `color` attribute in the vertex shader.
@@ -100,4 +146,14 @@ class GraphicObject(abc.ABC):
             texture_coord_loc: Location of the vertex attribute associated with
                 the texture's coordinate. This argument is only provided by th
                  drawer if using textures is enabled.
+            instance_model_loc: Location of the vertex attribute (a `mat4`)
+                associated with the per-instance model matrix. When the
+                attribute's arrays are disabled, it holds an identity matrix.
+                This argument is only provided by the drawer if using textures
+                is enabled.
+            vertex_color_loc: Location of the vertex attribute associated with
+                per-vertex colors, which multiply the `color` uniform. When the
+                attribute's array is disabled, it holds white (all ones). This
+                argument is only provided by the drawer if using textures is
+                disabled.
         """
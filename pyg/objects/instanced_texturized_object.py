@@ -0,0 +1,181 @@
+""" Implements a texturized graphic object that is drawn multiple times (once
+per instance) with a single draw call.
+"""
+
+from __future__ import annotations
+
+import ctypes
+from typing import Optional, Any
+from collections.abc import Sequence
+
+import numpy as np
+import OpenGL.GL as gl
+
+from pyg.utils import Coord2D, Coord3D, box_corners
+from pyg.texture import Texture
+from pyg.enums.primitive_shape import PrimitiveShape
+from .texturized_object import TexturizedGraphicObject
+
+
+class InstancedTexturizedGraphicObject(TexturizedGraphicObject):
+    """ Represents many copies (instances) of a texturized graphic object.
+
+    All the instances share the same vertices and texture, differing only by
+    their transformation matrices. They are all drawn by a single instanced
+    draw call, which is much cheaper than drawing each copy as a separate
+    object.
+
+    The final model matrix of an instance is given by the object's model matrix
+    (see :attr:`GraphicObject.model_matrix`) multiplied by the instance's own
+    transformation matrix.
+    """
+
+    def __init__(self,
+                 vertices: Sequence[Coord2D] | Sequence[Coord3D] | np.ndarray,
+                 texture: Texture,
+                 instance_transforms: Optional[np.ndarray] = None,
+                 initial_model: Optional[np.ndarray] = None,
+                 primitive: PrimitiveShape = PrimitiveShape.TRIANGLES) -> None:
+        """ Instantiates a new instanced texturized graphic object.
+
+        Args:
+            vertices: Coordinates of the vertices shared by all the instances.
+            texture: Texture shared by all the instances.
+            instance_transforms: Optional NumPy array with shape `(n, 4, 4)`
+                containing the transformation matrices of the object's `n`
+                instances. If not provided, the object starts with no
+                instances.
+            initial_model: Optional initial value for the object's model matrix.
+                If provided, it must be a 4x4 NumPy array. If not provided, an
+                identity matrix is used.
+            primitive: The OpenGL primitive used to connect the vertices.
+        """
+        self._instance_vbo: Optional[Any] = None
+        self._instance_transforms = np.empty((0, 4, 4), dtype=np.float32)
+        self._instances_changed = True
+        super().__init__(vertices=vertices,
+                         texture=texture,
+                         initial_model=initial_model,
+                         primitive=primitive)
+
+        if instance_transforms is not None:
+            self.instance_transforms = instance_transforms
+
+    @property
+    def instance_transforms(self) -> np.ndarray:
+        """ NumPy array with shape `(n, 4, 4)` containing the transformation
+        matrices of the object's `n` instances.
+        """
+        return self._instance_transforms
+
+    @instance_transforms.setter
+    def instance_transforms(self, new_transforms: np.ndarray) -> None:
+        """ Sets the transformation matrices of all the object's instances. """
+        new_transforms = np.array(new_transforms, dtype=np.float32)
+        assert len(new_transforms.shape) == 3
+        assert new_transforms.shape[1:] == (4, 4)
+        self._instance_transforms = new_transforms
+        self._instances_changed = True
+        self._bounding_box = None
+
+    @property
+    def num_instances(self) -> int:
+        """ The number of instances of this object. """
+        return self._instance_transforms.shape[0]
+
+    def add_instance(self, transform: np.ndarray) -> int:
+        """ Adds a new instance of the object.
+
+        Args:
+            transform: 4x4 NumPy array with the transformation matrix of the
+                new instance.
+
+        Returns:
+            The index of the new instance.
+        """
+        assert transform.shape == (4, 4)
+        self.instance_transforms = np.concatenate([
+            self._instance_transforms,
+            transform[np.newaxis].astype(np.float32),
+        ])
+        return self.num_instances - 1
+
+    def _compute_bounding_box(self) -> tuple[np.ndarray, np.ndarray]:
+        """ Computes the AABB enclosing all the object's instances. """
+        if self.num_instances == 0:
+            center = self.model_matrix[:3, 3].copy()
+            return center, center.copy()
+
+        corners = box_corners(*self._local_bounding_box)
+        models = self.model_matrix @ self._instance_transforms
+        world = (corners @ models.transpose(0, 2, 1))[..., :3].reshape(-1, 3)
+        return world.min(axis=0), world.max(axis=0)
+
+    def draw(self,
+             *,
+             color_loc: Optional[Any] = None,
+             texture_coord_loc: Optional[Any] = None,
+             instance_model_loc: Optional[Any] = None,
+             vertex_color_loc: Optional[Any] = None) -> None:
+        assert instance_model_loc is not None
+        if self.num_instances == 0:
+            return
+
+        self._send_texture_coordinates(texture_coord_loc)
+
+        # Send the instances' matrices to the GPU, if they have changed. The
+        # matrices are transposed because OpenGL expects the columns of a
+        # `mat4` attribute to be contiguous.
+        if self._instance_vbo is None:
+            self._instance_vbo = gl.glGenBuffers(1)
+        gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._instance_vbo)
+        if self._instances_changed:
+            data = np.ascontiguousarray(
+                self._instance_transforms.transpose(0, 2, 1),
+            )
+            gl.glBufferData(gl.GL_ARRAY_BUFFER,
+                            data.nbytes,
+                            data,
+                            gl.GL_STATIC_DRAW)
+            self._instances_changed = False
+
+        # A `mat4` attribute takes 4 consecutive locations, one per column.
+        # Each column advances once per instance instead of once per vertex.
+        for i in range(4):
+            gl.glEnableVertexAttribArray(instance_model_loc + i)
+            gl.glVertexAttribPointer(
+                instance_model_loc + i,
+                4,
+                gl.GL_FLOAT,
+                False,
+                16 * 4,
+                ctypes.c_void_p(16 * i),
+            )
+            gl.glVertexAttribDivisor(instance_model_loc + i, 1)
+
+        # Bind the texture and draw all the instances.
+        self._texture.bind()
+        gl.glDrawArraysInstanced(self._primitive.value,
+                                 0,
+                                 self._num_vertices,
+                                 self.num_instances)
+
+        # Restore the attribute's default value (identity matrix), so the
+        # objects drawn next aren't affected by the instances' matrices.
+        for i in range(4):
+            gl.glVertexAttribDivisor(instance_model_loc + i, 0)
+            gl.glDisableVertexAttribArray(instance_model_loc + i)
+            gl.glVertexAttrib4f(instance_model_loc + i,
+                                *(1.0 if i == j else 0.0 for j in range(4)))
+
+    def delete(self) -> None:
+        """ Deletes the OpenGL buffer holding the instances' matrices.
+
+        Should be called, within the GL context in which the object was drawn,
+        when a short-lived object won't be drawn again. If the object is drawn
+        afterwards, the buffer is recreated.
+        """
+        if self._instance_vbo is not None:
+            gl.glDeleteBuffers(1, [self._instance_vbo])
+            self._instance_vbo = None
+            self._instances_changed = True
@@ -2,10 +2,9 @@
 """
 
 from __future__ import annotations
-from typing import Optional, Any
+from typing import Optional
 
 import numpy as np
-import OpenGL.GL as gl
 
 from pyg.objects.simple_graphic_object import SimpleGraphicObject
 from pyg.enums.primitive_shape import PrimitiveShape
@@ -45,8 +44,10 @@ class Line(SimpleGraphicObject):
             fill_mode=fill_mode,
         )
 
-    def draw(self,
-             color_loc: Optional[Any] = None,
-             texture_coord_loc: Optional[Any] = None) -> None:
-        gl.glLineWidth(self._width)
-        super().draw(color_loc)
+    @property
+    def line_width(self) -> int:
+        """ The line's width, in pixels.
+
+        It's set by the drawer before the object is drawn.
+        """
+        return self._width
@@ -0,0 +1,185 @@
+""" Implements a graphic object that merges many simple graphic objects, so they
+can be drawn with a few draw calls.
+"""
+
+from __future__ import annotations
+
+import ctypes
+from typing import Optional, Any
+from collections.abc import Sequence
+
+import numpy as np
+import OpenGL.GL as gl
+
+from pyg.enums.fill_mode import FillMode
+from pyg.enums.primitive_shape import PrimitiveShape
+from .graphic_object import GraphicObject
+from .simple_graphic_object import SimpleGraphicObject
+
+
+def _to_list_primitive(
+    primitive: PrimitiveShape,
+    num_vertices: int,
+) -> tuple[PrimitiveShape, np.ndarray]:
+    """ Converts a primitive to the equivalent "list" primitive (points, lines
+    or triangles), whose vertex streams can be concatenated.
+
+    Returns:
+        A tuple with the list primitive and the indices, in the original vertex
+        stream, of the vertices to be drawn with it.
+    """
+    n = num_vertices
+    if primitive in (PrimitiveShape.POINTS,
+                     PrimitiveShape.LINES,
+                     PrimitiveShape.TRIANGLES):
+        return primitive, np.arange(n)
+
+    if primitive in (PrimitiveShape.LINE_STRIP, PrimitiveShape.LINE_LOOP):
+        starts = np.arange(n - 1 if primitive == PrimitiveShape.LINE_STRIP
+                           else n)
+        indices = np.stack([starts, (starts + 1) % n], axis=1)
+        return PrimitiveShape.LINES, indices.ravel()
+
+    i = np.arange(1, n - 1)
+    if primitive == PrimitiveShape.TRIANGLE_FAN:
+        indices = np.stack([np.zeros_like(i), i, i + 1], axis=1)
+    else:
+        # Every other triangle of a strip has its winding order reversed.
+        i = i - 1
+        odd = i % 2
+        indices = np.stack([i + odd, i + 1 - odd, i + 2], axis=1)
+    return PrimitiveShape.TRIANGLES, indices.ravel()
+
+
+class MergedGraphicObject(GraphicObject):
+    """ Merges many simple graphic objects into a single graphic object.
+
+    The vertices of the merged objects are transformed by their model matrices
+    and stored, together with a per-vertex copy of their colors, in a single
+    vertex stream. Objects with the same fill mode are drawn together, so only
+    a few draw calls (at most one per fill mode and primitive type) are needed
+    to draw all of them.
+
+    Objects are drawn in the order in which their groups (fill mode and
+    primitive type) first appear, and in their original order within each
+    group. The size of points and the width of lines (see :class:`Dot` and
+    :class:`Line`) are not preserved.
+
+    Since the objects are copied, changes made to them after the merged object
+    is created aren't reflected in it. The merged object can be transformed as
+    a whole through its own model matrix.
+    """
+
+    def __init__(self,
+                 objects: Sequence[SimpleGraphicObject],
+                 initial_model: Optional[np.ndarray] = None) -> None:
+        """ Instantiates a new merged graphic object.
+
+        Args:
+            objects: The objects to be merged.
+            initial_model: Optional initial value for the object's model matrix.
+                If provided, it must be a 4x4 NumPy array. If not provided, an
+                identity matrix is used.
+        """
+        groups: dict[tuple[PrimitiveShape, FillMode],
+                     tuple[list[np.ndarray], list[np.ndarray]]] = {}
+        for obj in objects:
+            primitive, indices = _to_list_primitive(obj.primitive,
+                                                    len(obj.vertices))
+
+            # Polygons filled with points are drawn as their vertices, so there
+            # is no need to repeat the vertices shared by their triangles.
+            if (obj.fill_mode == FillMode.POINT
+                    and primitive == PrimitiveShape.TRIANGLES):
+                primitive = PrimitiveShape.POINTS
+                indices = np.arange(len(obj.vertices))
+
+            model = obj.model_matrix
+            vertices = (obj.vertices[indices] @ model[:3, :3].T
+                        + model[:3, 3])
+            colors = np.broadcast_to(obj.color, (len(vertices), 4))
+
+            group_vertices, group_colors = groups.setdefault(
+                (primitive, obj.fill_mode), ([], []),
+            )
+            group_vertices.append(vertices)
+            group_colors.append(colors)
+
+        # Lay out the groups contiguously and record their ranges.
+        self._groups: list[tuple[PrimitiveShape, FillMode, int, int]] = []
+        all_vertices: list[np.ndarray] = []
+        all_colors: list[np.ndarray] = []
+        first = 0
+        for key, (group_vertices, group_colors) in groups.items():
+            count = sum(len(v) for v in group_vertices)
+            self._groups.append((*key, first, count))
+            all_vertices += group_vertices
+            all_colors += group_colors
+            first += count
+
+        self._colors = (np.concatenate(all_colors).astype(np.float32)
+                        if all_colors else np.empty((0, 4), dtype=np.float32))
+        self._color_vbo: Optional[Any] = None
+        super().__init__(
+            vertices=(np.concatenate(all_vertices) if all_vertices
+                      else np.empty((0, 3), dtype=np.float32)),
+            initial_model=initial_model,
+        )
+
+    @property
+    def colors(self) -> np.ndarray:
+        """ NumPy array of shape `(n, 4)` containing the RGBA colors of the
+        object's `n` vertices.
+        """
+        return self._colors
+
+    def draw(self,
+             *,
+             color_loc: Optional[Any] = None,
+             texture_coord_loc: Optional[Any] = None,
+             instance_model_loc: Optional[Any] = None,
+             vertex_color_loc: Optional[Any] = None) -> None:
+        assert color_loc is not None and vertex_color_loc is not None
+        if len(self.vertices) == 0:
+            return
+
+        # The colors never change, so they are sent to the GPU only once.
+        if self._color_vbo is None:
+            self._color_vbo = gl.glGenBuffers(1)
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._color_vbo)
+            gl.glBufferData(gl.GL_ARRAY_BUFFER,
+                            self._colors.nbytes,
+                            self._colors,
+                            gl.GL_STATIC_DRAW)
+        else:
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._color_vbo)
+
+        gl.glEnableVertexAttribArray(vertex_color_loc)
+        gl.glVertexAttribPointer(vertex_color_loc,
+                                 4,
+                                 gl.GL_FLOAT,
+                                 False,
+                                 4 * 4,
+                                 ctypes.c_void_p(0))
+
+        # The per-vertex colors are multiplied by the `color` uniform.
+        gl.glUniform4f(color_loc, 1.0, 1.0, 1.0, 1.0)
+        for primitive, fill_mode, first, count in self._groups:
+            gl.glPolygonMode(gl.GL_FRONT_AND_BACK, fill_mode.value)
+            gl.glDrawArrays(primitive.value, first, count)
+
+        # Restore the attribute's default value (white), so the objects drawn
+        # next aren't affected by these colors.
+        gl.glDisableVertexAttribArray(vertex_color_loc)
+        gl.glVertexAttrib4f(vertex_color_loc, 1.0, 1.0, 1.0, 1.0)
+
+    def delete(self) -> None:
+        """ Deletes the OpenGL buffer holding the object's colors.
+
+        Should be called, within the GL context in which the object was drawn,
+        when a short-lived object won't be drawn again. If the object is drawn
+        afterwards, the buffer is recreated.
+        """
+        if self._color_vbo is not None:
+            gl.glDeleteBuffers(1, [self._color_vbo])
+            self._color_vbo = None
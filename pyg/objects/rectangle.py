@@ -2,7 +2,7 @@
 """
 
 from __future__ import annotations
-from typing import Optional
+from typing import Final, Optional
 
 import numpy as np
 
@@ -12,8 +12,34 @@ from pyg.enums.fill_mode import FillMode
 from pyg.utils import Coord2D, Coord3D, Color
 
 
+#: Vertices (top-left, bottom-left, top-right and bottom-right) of a rectangle
+#: with its top-left vertex at the origin and unit width and height. It's
+#: read-only, so all the rectangles share it.
+_UNIT_RECT: Final[np.ndarray] = np.array([
+    (0, 0, 0),
+    (0, -1, 0),
+    (1, 0, 0),
+    (1, -1, 0),
+], dtype=np.float32)
+_UNIT_RECT.flags.writeable = False
+
+
 class Rectangle(SimpleGraphicObject):
-    """ Graphic object representing a rectangle. """
+    """ Graphic object representing a rectangle.
+
+    All rectangles share the same (read-only) vertices, those of a unit
+    rectangle, which are scaled and moved into place by the rectangle's initial
+    model matrix. This way, the drawer doesn't need to send the vertices of
+    consecutive rectangles to the GPU again.
+
+    Note:
+        Since the rectangle's position and size are part of its model matrix,
+        :attr:`vertices` returns the unit rectangle's vertices, not the
+        rectangle's. A matrix assigned to `transform.matrix` replaces the
+        placement, so it must include it (transformations like
+        `transform.translate()` are still applied on top of it). Calling
+        `transform.reset()` moves the rectangle back to its initial placement.
+    """
 
     def __init__(self,
                  top_left: Coord2D | Coord3D | np.ndarray,
@@ -32,25 +58,16 @@ class Rectangle(SimpleGraphicObject):
                 be used.
             fill_mode: Specifies how the object should be filled.
         """
-        size = np.array(size) * 2
-        top_left = np.array(top_left, dtype=np.float32)
-        other_vertices = np.array([
-            (top_left[0], top_left[1] - size[1]),  # bottom-left
-            (top_left[0] + size[0], top_left[1]),  # top-right
-            (top_left[0] + size[0], top_left[1] - size[1]),  # bottom-right
-        ], dtype=np.float32)
-
-        if len(top_left) == 3:
-            other_vertices = np.hstack([
-                other_vertices,
-                np.full([other_vertices.shape[0], 1],
-                        top_left[-1],
-                        dtype=np.float32),
-            ])
+        # Scale and move the unit rectangle into place.
+        top_left = np.asarray(top_left, dtype=np.float32)
+        initial_model = np.eye(4, dtype=np.float32)
+        initial_model[[0, 1], [0, 1]] = 2 * np.asarray(size, dtype=np.float32)
+        initial_model[:len(top_left), 3] = top_left
 
         super().__init__(
-            vertices=np.vstack([top_left, other_vertices]),
+            vertices=_UNIT_RECT,
             primitive=PrimitiveShape.TRIANGLE_STRIP,
             color=color,
+            initial_model=initial_model,
             fill_mode=fill_mode,
         )
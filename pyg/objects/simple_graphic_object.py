@@ -21,7 +21,7 @@ class SimpleGraphicObject(GraphicObject, Colored):
     """
 
     def __init__(self,
-                 vertices: Sequence[Coord2D] | Sequence[Coord3D],
+                 vertices: Sequence[Coord2D] | Sequence[Coord3D] | np.ndarray,
                  primitive: PrimitiveShape,
                  color: Optional[Color | np.ndarray] = None,
                  initial_model: Optional[np.ndarray] = None,
@@ -47,8 +47,10 @@ class SimpleGraphicObject(GraphicObject, Colored):
 
     def draw(self,
              color_loc: Optional[Any] = None,
-             texture_coord_loc: Optional[Any] = None) -> None:
+             texture_coord_loc: Optional[Any] = None,
+             instance_model_loc: Optional[Any] = None,
+             vertex_color_loc: Optional[Any] = None) -> None:
         assert color_loc is not None
-        gl.glUniform4f(color_loc, *self.color)
+        gl.glUniform4fv(color_loc, 1, self.color)
         gl.glPolygonMode(gl.GL_FRONT_AND_BACK, self.fill_mode.value)
-        gl.glDrawArrays(self.primitive.value, 0, len(self.vertices))
+        gl.glDrawArrays(self.primitive.value, 0, self._num_vertices)
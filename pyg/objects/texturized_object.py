@@ -4,7 +4,9 @@
 from __future__ import annotations
 
 import ctypes
-from typing import Optional, Any
+import itertools
+import weakref
+from typing import Optional, Any, Final, TypeVar, TYPE_CHECKING
 from collections.abc import Sequence
 
 import numpy as np
@@ -15,12 +17,78 @@ from pyg.texture import Texture
 from pyg.enums.primitive_shape import PrimitiveShape
 from .graphic_object import GraphicObject
 
+if TYPE_CHECKING:
+    from pyg.texture_atlas import TextureAtlas
+    from pyg.window import Window
+
+
+#: Generic variable indicating a subclass of `TexturizedGraphicObject`.
+T = TypeVar("T", bound="TexturizedGraphicObject")
+
+#: Key identifying an asset loaded by `_load_asset()`: the paths of its file and
+#: of its texture's image, and the atlas containing the image.
+_AssetKey = tuple[str, str, Optional["TextureAtlas"]]
+
+#: Assets already loaded, per window. Their textures belong to the GL context
+#: of the window in which they were created, so they are only reused by objects
+#: loaded in that window, and they are released together with the window.
+_ASSET_CACHE: Final[weakref.WeakKeyDictionary[
+    Window, dict[_AssetKey, tuple[np.ndarray, Texture]]
+]] = weakref.WeakKeyDictionary()
+
+
+def _load_asset(window: Optional[Window],
+                file_path: str,
+                texture_img_path: str,
+                atlas: Optional[TextureAtlas]) -> tuple[np.ndarray, Texture]:
+    """ Loads the vertices and the texture of a Wavefront file, within the GL
+    context of the given window.
+
+    The results are cached per window, so each file is only parsed (and each
+    texture only decoded and sent to the GPU) once per window. If no window is
+    given, nothing is cached. The returned arrays are read-only, since they are
+    shared by all the objects loaded from the same file.
+    """
+    key = (file_path, texture_img_path, atlas)
+    assets = _ASSET_CACHE.setdefault(window, {}) if window is not None else {}
+    if key not in assets:
+        assets[key] = _read_asset(*key)
+    return assets[key]
+
+
+def _read_asset(file_path: str,
+                texture_img_path: str,
+                atlas: Optional[TextureAtlas]) -> tuple[np.ndarray, Texture]:
+    """ Reads the vertices of a Wavefront file and creates its texture. """
+    obj_data = load_wavefront(file_path)
+    faces = obj_data["faces"]
+
+    # Gather the faces' vertices and texture coordinates with fancy indexing.
+    vertex_ids = np.fromiter(itertools.chain.from_iterable(f[0] for f in faces),
+                             dtype=np.intp)
+    texture_ids = np.fromiter(
+        itertools.chain.from_iterable(f[1] for f in faces), dtype=np.intp,
+    )
+    assert len(vertex_ids) == len(texture_ids)
+
+    vertices_array = obj_data["vertices"][vertex_ids - 1]
+    texture_coords = obj_data["texture"][texture_ids - 1]
+    if atlas is not None:
+        texture = atlas.texture(texture_coords, texture_img_path)
+    else:
+        texture = Texture(coordinates=texture_coords,
+                          img_path=texture_img_path)
+
+    vertices_array.flags.writeable = False
+    texture.coordinates.flags.writeable = False
+    return vertices_array, texture
+
 
 class TexturizedGraphicObject(GraphicObject):
     """ Represents a graphic object that has a texture. """
 
     def __init__(self,
-                 vertices: Sequence[Coord2D] | Sequence[Coord3D],
+                 vertices: Sequence[Coord2D] | Sequence[Coord3D] | np.ndarray,
                  texture: Texture,
                  initial_model: Optional[np.ndarray] = None,
                  primitive: PrimitiveShape = PrimitiveShape.TRIANGLES) -> None:
@@ -28,18 +96,33 @@ class TexturizedGraphicObject(GraphicObject):
         self._primitive = primitive
         super().__init__(vertices=vertices, initial_model=initial_model)
 
+    @property
+    def texture(self) -> Texture:
+        """ The object's texture. """
+        return self._texture
+
+    @property
+    def primitive(self) -> PrimitiveShape:
+        """ The OpenGL primitive used to connect the object's vertices. """
+        return self._primitive
+
     def draw(self,
              *,
              color_loc: Optional[Any] = None,
-             texture_coord_loc: Optional[Any] = None) -> None:
-        # Send the texture's coordinates to the buffer. The buffer is expected
-        # to have already been bound.
-        gl.glBufferData(
-            gl.GL_ARRAY_BUFFER,
-            self._texture.coordinates.nbytes,
-            self._texture.coordinates,
-            gl.GL_DYNAMIC_DRAW,
-        )
+             texture_coord_loc: Optional[Any] = None,
+             instance_model_loc: Optional[Any] = None,
+             vertex_color_loc: Optional[Any] = None) -> None:
+        self._send_texture_coordinates(texture_coord_loc)
+
+        # Bind the texture and draw the object.
+        self._texture.bind()
+        gl.glDrawArrays(self._primitive.value, 0, self._num_vertices)
+
+    def _send_texture_coordinates(self, texture_coord_loc: Any) -> None:
+        """ Binds the buffer holding the texture's coordinates and associates
+        them with the given vertex attribute.
+        """
+        self._texture.bind_coordinates()
 
         # Associate the texture's coordinates with the appropriate attribute.
         gl.glEnableVertexAttribArray(texture_coord_loc)
@@ -52,39 +135,40 @@ class TexturizedGraphicObject(GraphicObject):
             ctypes.c_void_p(0),
         )
 
-        # Bind the texture and draw the object.
-        self._texture.bind()
-        gl.glDrawArrays(self._primitive.value, 0, len(self.vertices))
-
-    @staticmethod
+    @classmethod
     def from_file(
+        cls: type[T],
         file_path: str,
         texture_img_path: str,
         primitive: PrimitiveShape = PrimitiveShape.TRIANGLES,
-    ) -> TexturizedGraphicObject:
+        atlas: Optional[TextureAtlas] = None,
+    ) -> T:
         """ Loads a texturized graphic object from a file.
 
+        Files are only parsed once per window: objects loaded from the same
+        file (and with the same texture image and atlas) in the same window
+        share their texture and their (read-only) vertices, differing only by
+        their model matrices. Must be called within the GL context of the
+        window in which the object will be drawn (e.g., after the window is
+        created).
+
         Args:
             file_path: Path to the object's file. Currently, only Wavefront
                 files are supported.
             texture_img_path: Path to the image associated with the object's
                 texture.
+            primitive: The OpenGL primitive used to connect the vertices.
+            atlas: Optional texture atlas containing the texture's image. If
+                provided, the object uses the atlas' texture instead of loading
+                the image again.
 
         Returns:
             The built object.
         """
-        obj_data = load_wavefront(file_path)
-        vertices, texture_coords = [], []
-        for face in obj_data["faces"]:
-            vertices += [obj_data["vertices"][vid - 1] for vid in face[0]]
-            texture_coords += [obj_data["texture"][tid - 1] for tid in face[1]]
-
-        assert len(vertices) == len(texture_coords)
-        return TexturizedGraphicObject(
-            vertices=vertices,
-            texture=Texture(
-                coordinates=texture_coords,
-                img_path=texture_img_path,
-            ),
-            primitive=primitive,
-        )
+        # pylint: disable=C0415,W0212
+        from pyg.window import Window
+        vertices, texture = _load_asset(Window._current,
+                                        file_path,
+                                        texture_img_path,
+                                        atlas)
+        return cls(vertices=vertices, texture=texture, primitive=primitive)
@@ -1,19 +1,27 @@
 """ Implements a class representing a texture in OpenGL.
 """
 
+from __future__ import annotations
+
+import copy
+from typing import Any, Optional, TYPE_CHECKING
 from collections.abc import Sequence
 
 import numpy as np
 import OpenGL.GL as gl
-from PIL import Image
 
 from pyg.utils import Coord2D
 
+if TYPE_CHECKING:
+    from PIL import Image
+
 
 class Texture:
     """ Represents a texture in OpenGL. """
 
-    def __init__(self, coordinates: Sequence[Coord2D], img_path: str) -> None:
+    def __init__(self,
+                 coordinates: Sequence[Coord2D] | np.ndarray,
+                 img_path: str | Image.Image) -> None:
         """ Creates a new texture.
 
         Ideally, this constructor should be called within the GL context of the
@@ -22,7 +30,7 @@ class Texture:
         Args:
             coordinates: Sequence with the 2D coordinates of the texture.
             img_path: Path to the file containing the image associated with the
-                texture.
+                texture. An already loaded PIL image can also be given.
         """
         self._coordinates = np.array(coordinates, dtype=np.float32)
         assert len(self._coordinates.shape) == 2
@@ -30,6 +38,7 @@ class Texture:
 
         self._img_path = img_path
         self._id = gl.glGenTextures(1)
+        self._coordinates_vbo: Optional[Any] = None
 
         self.bind()
 
@@ -45,8 +54,11 @@ class Texture:
                            gl.GL_TEXTURE_MAG_FILTER,
                            gl.GL_LINEAR)
 
-        # Load the texture's image and send it to the GPU.
-        img = Image.open(img_path)
+        # Load the texture's image and send it to the GPU. PIL is only imported
+        # once a texture is created, so it isn't loaded with the library.
+        from PIL import Image  # pylint: disable=C0415
+        img = (img_path if isinstance(img_path, Image.Image)
+               else Image.open(img_path))
         gl.glTexImage2D(
             gl.GL_TEXTURE_2D,
             0,
@@ -64,6 +76,62 @@ class Texture:
         """ NumPy array with the texture's coordinates. Shape: (n, 2). """
         return self._coordinates
 
+    @property
+    def gl_id(self) -> int:
+        """ OpenGL's name (ID) of the texture. """
+        return self._id
+
+    def with_coordinates(
+        self,
+        coordinates: Sequence[Coord2D] | np.ndarray,
+    ) -> Texture:
+        """ Returns a copy of this texture with different coordinates.
+
+        The copy shares the image (and the GPU texture) of the original, so no
+        image is loaded or uploaded.
+
+        Args:
+            coordinates: Sequence with the 2D coordinates of the new texture.
+        """
+        new_coordinates = np.array(coordinates, dtype=np.float32)
+        assert len(new_coordinates.shape) == 2
+        assert new_coordinates.shape[1] == 2
+
+        texture = copy.copy(self)
+        texture._coordinates = new_coordinates  # pylint: disable=W0212
+        texture._coordinates_vbo = None  # pylint: disable=W0212
+        return texture
+
     def bind(self) -> None:
         """ Binds the texture to the current OpenGL context. """
         gl.glBindTexture(gl.GL_TEXTURE_2D, self._id)
+
+    def bind_coordinates(self) -> None:
+        """ Binds, as the current array buffer, an OpenGL buffer holding the
+        texture's coordinates.
+
+        The coordinates never change, so they are only sent to the GPU the first
+        time this is called. Must be called within the GL context of the window
+        in which the texture is drawn.
+        """
+        if self._coordinates_vbo is None:
+            self._coordinates_vbo = gl.glGenBuffers(1)
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._coordinates_vbo)
+            gl.glBufferData(gl.GL_ARRAY_BUFFER,
+                            self._coordinates.nbytes,
+                            self._coordinates,
+                            gl.GL_STATIC_DRAW)
+        else:
+            gl.glBindBuffer(gl.GL_ARRAY_BUFFER, self._coordinates_vbo)
+
+    def release_coordinates(self) -> None:
+        """ Deletes the OpenGL buffer holding the texture's coordinates (see
+        :meth:`bind_coordinates`), but not the texture itself.
+
+        Should be called, within the GL context in which the texture was drawn,
+        when a short-lived texture won't be drawn again. If the texture is drawn
+        afterwards, the buffer is recreated.
+        """
+        if self._coordinates_vbo is not None:
+            gl.glDeleteBuffers(1, [self._coordinates_vbo])
+            self._coordinates_vbo = None
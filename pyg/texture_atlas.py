@@ -0,0 +1,140 @@
+""" Implements a texture atlas, which packs many images into a single texture.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from pyg.utils import Coord2D
+from pyg.texture import Texture
+
+
+class TextureAtlas:
+    """ Packs many images into a single OpenGL texture (an atlas).
+
+    Objects whose textures are in the same atlas share the same OpenGL texture,
+    so no texture needs to be bound between their draw calls (and they can be
+    merged by :meth:`pyg.Window.draw_batch`).
+
+    The images are placed with a simple shelf packer: they are sorted by
+    height, in descending order, and laid out from left to right in rows
+    ("shelves"), starting a new row when the current one is full.
+
+    Texture coordinates outside of the `[0, 1]` range can't be used with an
+    atlas, since they would sample neighbouring images instead of repeating the
+    texture. They are clipped to that range.
+    """
+
+    def __init__(self,
+                 img_paths: Sequence[str],
+                 max_size: int = 4096) -> None:
+        """ Creates a new texture atlas.
+
+        Ideally, this constructor should be called within the GL context of the
+        window in which the atlas will be drawn.
+
+        Args:
+            img_paths: Paths to the images to be packed. Duplicated paths are
+                only packed once.
+            max_size: Maximum width and height of the atlas, in pixels.
+
+        Raises:
+            ValueError: If the images don't fit in an atlas of the given maximum
+                size.
+        """
+        from PIL import Image  # pylint: disable=C0415
+
+        # Decode the images in parallel (Pillow releases the GIL while
+        # decoding).
+        paths = list(dict.fromkeys(img_paths))
+        with ThreadPoolExecutor() as executor:
+            images = dict(zip(paths, executor.map(
+                lambda path: Image.open(path).convert("RGB"), paths,
+            )))
+        assert images
+
+        # Place the images in shelves, from the tallest to the shortest.
+        width = max(img.size[0] for img in images.values())
+        area = sum(img.size[0] * img.size[1] for img in images.values())
+        width = min(max(width, 2 ** int(np.ceil(np.log2(np.sqrt(area))))),
+                    max_size)
+
+        positions: dict[str, tuple[int, int]] = {}
+        x = shelf_y = shelf_height = 0
+        for path, img in sorted(images.items(),
+                                key=lambda item: -item[1].size[1]):
+            img_width, img_height = img.size
+            if img_width > width:
+                raise ValueError(f"The image \"{path}\" is wider than the "
+                                 f"atlas' maximum size ({max_size}).")
+
+            if x + img_width > width:
+                x, shelf_y = 0, shelf_y + shelf_height
+                shelf_height = 0
+
+            positions[path] = (x, shelf_y)
+            x += img_width
+            shelf_height = max(shelf_height, img_height)
+
+        height = shelf_y + shelf_height
+        if height > max_size:
+            raise ValueError(f"The images don't fit in an atlas with the "
+                             f"maximum size of {max_size}x{max_size}.")
+
+        # Build the atlas' image and record the region of each input image.
+        atlas_img = Image.new("RGB", (width, height))
+        self._regions: dict[str, tuple[float, float, float, float]] = {}
+        for path, (x, y) in positions.items():
+            img_width, img_height = images[path].size
+            atlas_img.paste(images[path], (x, y))
+
+            # The texture is flipped vertically when sent to the GPU, so `v`
+            # grows from the bottom of the atlas. The regions are inset by half
+            # a texel, so linear filtering never samples neighbouring images.
+            self._regions[path] = (
+                (x + 0.5) / width,
+                1 - (y + img_height - 0.5) / height,
+                (x + img_width - 0.5) / width,
+                1 - (y + 0.5) / height,
+            )
+
+        self._size = (width, height)
+        self._texture = Texture(coordinates=np.zeros((0, 2)),
+                                img_path=atlas_img)
+
+    @property
+    def size(self) -> tuple[int, int]:
+        """ Width and height of the atlas, in pixels. """
+        return self._size
+
+    def __contains__(self, img_path: str) -> bool:
+        """ Checks whether the given image is in the atlas. """
+        return img_path in self._regions
+
+    def region(self, img_path: str) -> tuple[float, float, float, float]:
+        """ Returns the texture coordinates `(u0, v0, u1, v1)` of the region of
+        the atlas occupied by the given image.
+        """
+        return self._regions[img_path]
+
+    def texture(self,
+                coordinates: Sequence[Coord2D] | np.ndarray,
+                img_path: str) -> Texture:
+        """ Creates a texture that uses an image of the atlas.
+
+        Args:
+            coordinates: Sequence with the 2D coordinates of the texture,
+                relative to the original image.
+            img_path: Path to the original image. It must be in the atlas.
+
+        Returns:
+            A texture sharing the atlas' OpenGL texture, with its coordinates
+            remapped to the image's region in the atlas.
+        """
+        u0, v0, u1, v1 = self._regions[img_path]
+        uv = np.clip(np.array(coordinates, dtype=np.float32), 0, 1)
+        uv = uv * np.array([u1 - u0, v1 - v0]) + np.array([u0, v0])
+        return self._texture.with_coordinates(uv)
@@ -2,11 +2,29 @@
 transformation matrix.
 """
 
+import math
 from typing import Optional, Literal
 
 import numpy as np
 
 
+#: Read-only 4x4 identity matrix, copied instead of building a new identity
+#: matrix for each handler.
+_IDENTITY = np.eye(4, dtype=np.float32)
+_IDENTITY.flags.writeable = False
+
+#: Scratch matrices into which `translate()`, `scale()` and `rotate()` write
+#: their transformations, instead of building a new matrix on every call. The
+#: library is used from a single thread, so they can be shared.
+_TRANSLATION = np.eye(4, dtype=np.float32)
+_SCALING = np.eye(4, dtype=np.float32)
+_ROTATIONS = {axis: np.eye(4, dtype=np.float32) for axis in "xyz"}
+
+#: Indices `(i, j)` of the two axes spanning the plane of the rotation around
+#: each axis, ordered so that the rotation takes axis `i` towards axis `j`.
+_ROTATION_PLANES = {"x": (1, 2), "y": (2, 0), "z": (0, 1)}
+
+
 class TransformationHandler:
     """ Abstracts the interaction with a transformation matrix.
 
@@ -22,23 +40,43 @@ class TransformationHandler:
                 transformation matrix. If not provided, the initial matrix will
                 be an identity matrix.
         """
+        # The initial matrix is only ever copied, so it's kept read-only and,
+        # when it's an identity matrix, shared between all handlers.
         if initial_matrix is not None:
             assert initial_matrix.shape == (4, 4)
-            self._matrix = initial_matrix.astype(np.float32)
+            self._initial_matrix = np.array(initial_matrix,
+                                            dtype=np.float32,
+                                            order="C")
+            self._initial_matrix.flags.writeable = False
         else:
-            self._matrix = np.eye(4, dtype=np.float32)
-        self._initial_matrix: np.ndarray = self._matrix.copy()
+            self._initial_matrix = _IDENTITY
+        self._matrix = self._initial_matrix.copy()
+        self._version = 0
 
     @property
     def matrix(self) -> np.ndarray:
-        """ The current transformation matrix. """
+        """ The current transformation matrix.
+
+        It's always a C-contiguous `float32` array, so it can be sent to OpenGL
+        without being converted.
+        """
         return self._matrix
 
     @matrix.setter
     def matrix(self, new_matrix: np.ndarray) -> None:
         """ Manually sets the transformation matrix. """
         assert new_matrix.shape == (4, 4)
-        self._matrix = new_matrix
+        self._matrix = np.ascontiguousarray(new_matrix, dtype=np.float32)
+        self._version += 1
+
+    @property
+    def version(self) -> int:
+        """ Number of times the transformation matrix has been changed.
+
+        Values derived from the matrix can be cached and only recomputed when
+        this number changes.
+        """
+        return self._version
 
     def reset(self) -> None:
         """ Resets the transformation matrix to its initial value.
@@ -47,6 +85,7 @@ class TransformationHandler:
         handler, the new matrix will be an identity matrix.
         """
         self._matrix = self._initial_matrix.copy()
+        self._version += 1
 
     def __call__(self, transformation: np.ndarray) -> None:
         """ Applies the transformation specified by the provided matrix.
@@ -56,33 +95,43 @@ class TransformationHandler:
         """
         assert transformation.shape == (4, 4)
         self._matrix = np.matmul(transformation,
-                                 self._matrix).astype(np.float32)
+                                 self._matrix,
+                                 dtype=np.float32)
+        self._version += 1
 
-    def translate(self,
-                  tx: float = 0.0,
-                  ty: float = 0.0,
-                  tz: float = 0.0) -> None:
-        """ Applies a translation using the provided offsets.
+    @staticmethod
+    def translation_matrix(tx: float = 0.0,
+                           ty: float = 0.0,
+                           tz: float = 0.0) -> np.ndarray:
+        """ Builds the matrix of a translation by the provided offsets.
 
         Args:
             tx: Offset in the x-axis' direction. Defaults to 0.
             ty: Offset in the y-axis' direction. Defaults to 0.
             tz: Offset in the z-axis' direction. Defaults to 0.
+
+        Returns:
+            A 4x4 NumPy array with the translation matrix.
         """
-        self(np.array([
+        return np.array([
             [1, 0, 0, tx],
             [0, 1, 0, ty],
             [0, 0, 1, tz],
             [0, 0, 0,  1],
-        ]))
+        ], dtype=np.float32)
 
-    def rotate(self, angle: float, axis: Literal["x", "y", "z"] = "x") -> None:
-        """ Applies a rotation.
+    @staticmethod
+    def rotation_matrix(angle: float,
+                        axis: Literal["x", "y", "z"] = "x") -> np.ndarray:
+        """ Builds the matrix of a rotation.
 
         Args:
             angle: The rotation angle, in degrees.
             axis: The rotation axis ("x", "y" or "z"). Defaults to "x".
 
+        Returns:
+            A 4x4 NumPy array with the rotation matrix.
+
         Raises:
             ValueError: If `axis` contains an invalid value.
         """
@@ -90,28 +139,88 @@ class TransformationHandler:
         cos, sin = np.cos(angle), np.sin(angle)
 
         if axis == "x":
-            self(np.array([
+            rows = [
                 [1,  0,    0,     0],
                 [0,  cos,  -sin,  0],
                 [0,  sin,  cos,   0],
                 [0,  0,    0,     1],
-            ]))
+            ]
         elif axis == "y":
-            self(np.array([
+            rows = [
                 [cos,   0,   sin,  0],
                 [0,     1,   0,    0],
                 [-sin,  0,   cos,  0],
                 [0,     0,   0,    1],
-            ]))
+            ]
         elif axis == "z":
-            self(np.array([
+            rows = [
                 [cos,  -sin,  0,  0],
                 [sin,  cos,   0,  0],
                 [0,    0,     1,  0],
                 [0,    0,     0,  1],
-            ]))
+            ]
         else:
             raise ValueError(f"Invalid rotation axis \"{axis}\"!")
+        return np.array(rows, dtype=np.float32)
+
+    @staticmethod
+    def scaling_matrix(sx: float = 1.0,
+                       sy: float = 1.0,
+                       sz: float = 1.0) -> np.ndarray:
+        """ Builds the matrix of a scaling transformation.
+
+        Args:
+            sx: Scaling factor along the x-axis' direction. Defaults to 1.
+            sy: Scaling factor along the y-axis' direction. Defaults to 1.
+            sz: Scaling factor along the z-axis' direction. Defaults to 1.
+
+        Returns:
+            A 4x4 NumPy array with the scaling matrix.
+        """
+        return np.array([
+            [sx, 0, 0, 0],
+            [0, sy, 0, 0],
+            [0, 0, sz, 0],
+            [0, 0, 0,  1],
+        ], dtype=np.float32)
+
+    def translate(self,
+                  tx: float = 0.0,
+                  ty: float = 0.0,
+                  tz: float = 0.0) -> None:
+        """ Applies a translation using the provided offsets.
+
+        Args:
+            tx: Offset in the x-axis' direction. Defaults to 0.
+            ty: Offset in the y-axis' direction. Defaults to 0.
+            tz: Offset in the z-axis' direction. Defaults to 0.
+        """
+        _TRANSLATION[0, 3] = tx
+        _TRANSLATION[1, 3] = ty
+        _TRANSLATION[2, 3] = tz
+        self(_TRANSLATION)
+
+    def rotate(self, angle: float, axis: Literal["x", "y", "z"] = "x") -> None:
+        """ Applies a rotation.
+
+        Args:
+            angle: The rotation angle, in degrees.
+            axis: The rotation axis ("x", "y" or "z"). Defaults to "x".
+
+        Raises:
+            ValueError: If `axis` contains an invalid value.
+        """
+        if axis not in _ROTATION_PLANES:
+            raise ValueError(f"Invalid rotation axis \"{axis}\"!")
+
+        i, j = _ROTATION_PLANES[axis]
+        angle = math.radians(angle)
+        cos, sin = math.cos(angle), math.sin(angle)
+        rotation = _ROTATIONS[axis]
+        rotation[i, i] = rotation[j, j] = cos
+        rotation[i, j] = -sin
+        rotation[j, i] = sin
+        self(rotation)
 
     def scale(self,
               sx: float = 1.0,
@@ -124,9 +233,7 @@ class TransformationHandler:
             sy: Scaling factor along the y-axis' direction. Defaults to 1.
             sz: Scaling factor along the z-axis' direction. Defaults to 1.
         """
-        self(np.array([
-            [sx, 0, 0, 0],
-            [0, sy, 0, 0],
-            [0, 0, sz, 0],
-            [0, 0, 0,  1],
-        ]))
+        _SCALING[0, 0] = sx
+        _SCALING[1, 1] = sy
+        _SCALING[2, 2] = sz
+        self(_SCALING)
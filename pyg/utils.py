@@ -4,6 +4,9 @@
 from __future__ import annotations
 
 import abc
+import functools
+import itertools
+import math
 from typing import Optional
 
 import numpy as np
@@ -20,16 +23,63 @@ Coord3D = tuple[float, float, float]
 #: Represents a color (RGBA).
 Color = tuple[float, float, float, float]
 
+#: Number of entries in the sine lookup table used by `fast_sincos`.
+_SIN_LUT_SIZE = 1024
+
+#: Sine of `_SIN_LUT_SIZE` evenly spaced angles in `[0, 2*pi)`.
+_SIN_LUT = tuple(math.sin(2 * math.pi * i / _SIN_LUT_SIZE)
+                 for i in range(_SIN_LUT_SIZE))
+
+
+def fast_sincos(angle: float) -> tuple[float, float]:
+    """ Approximates the sine and the cosine of an angle with a lookup table.
+
+    The angle is rounded to the nearest of 1024 evenly spaced angles (an error
+    of at most ~0.18 degrees), which is accurate enough for animations and
+    movement directions, but not for precise computations. The cosine is read
+    from the same table as the sine, a quarter turn ahead.
+
+    Args:
+        angle: The angle, in degrees.
+
+    Returns:
+        A tuple with the approximate sine and cosine of the angle.
+    """
+    idx = int(round(angle * (_SIN_LUT_SIZE / 360))) & (_SIN_LUT_SIZE - 1)
+    return (_SIN_LUT[idx],
+            _SIN_LUT[(idx + _SIN_LUT_SIZE // 4) & (_SIN_LUT_SIZE - 1)])
+
+
+@functools.lru_cache(maxsize=256)
+def _color_array(color: Color) -> np.ndarray:
+    """ Returns a read-only array with the given RGBA values. The array is
+    shared by all the objects whose colors are set to an equal tuple.
+    """
+    array = np.array(color, dtype=np.float32)
+    assert array.shape == (4,)
+    array.flags.writeable = False
+    return array
+
 
 class Colored(abc.ABC):
     """ Represents a single-colored entity. """
 
+    #: The tuple from which the current color was built, if any.
+    _color_source: Optional[Color] = None
+
     def __init__(self, color: Optional[Color | np.ndarray] = None):
         self.color = color
 
     @property
     def color(self) -> np.ndarray:
-        """ NumPy array containing the RGBA values of the object's color. """
+        """ NumPy array containing the RGBA values of the object's color.
+
+        Colors set from tuples are shared with other objects, so the array is
+        read-only in that case and editing it in place (e.g. with
+        `obj.color[3] = 0.5`) raises a `ValueError`. To change such a color,
+        set a new one instead. Colors set from NumPy arrays are copied, so
+        their arrays belong to the object and can be edited in place.
+        """
         return self._color
 
     @color.setter
@@ -41,19 +91,89 @@ class Colored(abc.ABC):
                 values of the new color. If `None`, the object's color will be
                 set to a default value.
         """
+        # Setting the same tuple (which can't change) or the current array
+        # again doesn't need a new array.
+        if new_color is not None and (
+            new_color is self._color_source
+            or new_color is getattr(self, "_color", None)
+        ):
+            return
+
+        self._color_source = (new_color if isinstance(new_color, tuple)
+                              else None)
         if new_color is None:
             self._color = DEFAULT_COLOR
+        elif isinstance(new_color, tuple):
+            self._color = _color_array(new_color)
         else:
             new_color = np.array(new_color, dtype=np.float32)
             assert new_color.shape == (4,)
             self._color = new_color
 
 
+def box_corners(lower: np.ndarray, upper: np.ndarray) -> np.ndarray:
+    """ Returns the 8 corners, in homogeneous coordinates (shape `(8, 4)`), of
+    the axis-aligned box with the given minimum and maximum corners.
+    """
+    idx = np.indices((2, 2, 2)).reshape(3, -1).T
+    corners = np.where(idx == 0, lower, upper)
+    return np.hstack([corners, np.ones((8, 1))]).astype(np.float32)
+
+
+def boxes_in_frustum(planes: np.ndarray,
+                     lower: np.ndarray,
+                     upper: np.ndarray) -> np.ndarray:
+    """ Checks which axis-aligned boxes intersect a view frustum.
+
+    For each plane, only the box corner furthest along the plane's normal (the
+    "p-vertex") is tested: if it's behind the plane, the whole box is outside
+    the frustum. The test is conservative, meaning that a few boxes outside the
+    frustum (near its corners) might be reported as visible.
+
+    Args:
+        planes: NumPy array with shape `(6, 4)` containing the coefficients
+            `(a, b, c, d)` of the frustum's planes, with normals pointing to the
+            inside of the frustum.
+        lower: NumPy array with shape `(n, 3)` containing the minimum corners
+            of the `n` boxes.
+        upper: NumPy array with shape `(n, 3)` containing the maximum corners
+            of the `n` boxes.
+
+    Returns:
+        Boolean NumPy array with shape `(n,)` indicating which boxes are inside
+        or intersect the frustum.
+    """
+    normals = planes[:, :3]
+    p_vertices = np.where(normals >= 0,
+                          upper[:, np.newaxis, :],
+                          lower[:, np.newaxis, :])
+    dist = (p_vertices * normals).sum(axis=-1) + planes[:, 3]
+    return (dist >= 0).all(axis=1)
+
+
 def load_wavefront(pathname: str,
-                   vertices_only: bool = False) -> dict | list[Coord3D]:
-    """ Loads the contents of a Wavefront OBJ file. """
+                   vertices_only: bool = False) -> dict | np.ndarray:
+    """ Loads the contents of a Wavefront OBJ file.
+
+    The file's lines are only split in Python. The coordinates are converted
+    to numbers by NumPy, all at once.
+
+    Args:
+        pathname: Path to the file.
+        vertices_only: Whether to return only the vertices of the file's faces.
+
+    Returns:
+        If `vertices_only` is `False`, a dictionary with the file's vertices
+        (`"vertices"`, a float32 array with shape `(n, 3)`), texture
+        coordinates (`"texture"`, a float32 array with shape `(m, 2)`) and
+        faces (`"faces"`, a list of tuples with the face's 1-based vertex ids,
+        texture coordinate ids and material). Otherwise, a float32 array with
+        the coordinates of the faces' vertices, in order.
+    """
     material = None
-    model = {"vertices": [], "texture": [], "faces": []}
+    vertices: list[list[str]] = []
+    texture: list[list[str]] = []
+    faces: list[tuple[list[int], list[int], Optional[str]]] = []
 
     with open(pathname, "r") as file:
         for line in file:
@@ -68,10 +188,10 @@ def load_wavefront(pathname: str,
 
             # Extract vertices.
             if values[0] == "v":
-                model["vertices"].append(values[1:4])
+                vertices.append(values[1:4])
             # Extract texture coordinates.
             elif values[0] == "vt":
-                model["texture"].append(values[1:3])
+                texture.append(values[1:3])
             # Extract faces.
             elif values[0] in ("usemtl", "usemat"):
                 material = values[1]
@@ -85,10 +205,18 @@ def load_wavefront(pathname: str,
                         face_texture.append(int(w[1]))
                     else:
                         face_texture.append(0)
-                model["faces"].append((face, face_texture, material))
-
-    if not vertices_only:
-        return model
-
-    return [model["vertices"][vid - 1]
-            for face in model["faces"] for vid in face[0]]
+                faces.append((face, face_texture, material))
+
+    vertices_array = np.array(vertices, dtype=np.float32).reshape(-1, 3)
+    if vertices_only:
+        vertex_ids = np.fromiter(
+            itertools.chain.from_iterable(face[0] for face in faces),
+            dtype=np.intp,
+        )
+        return vertices_array[vertex_ids - 1]
+
+    return {
+        "vertices": vertices_array,
+        "texture": np.array(texture, dtype=np.float32).reshape(-1, 2),
+        "faces": faces,
+    }
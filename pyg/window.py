@@ -3,22 +3,38 @@
 
 from __future__ import annotations
 
-from typing import Optional, Any, TypeVar, Generic
+import contextlib
+import time
+import weakref
+from typing import ClassVar, Optional, Any, TypeVar, Generic
 from types import TracebackType
-from collections.abc import Callable
+from collections.abc import Callable, Iterable, Iterator
 
 import glfw
+import numpy as np
 import OpenGL.GL as gl
 
 from pyg.drawer import Drawer
 from pyg.enums.events import Key, KeyboardAction
 from pyg.cameras import Camera, SimpleCamera
+from pyg.objects import GraphicObject, TexturizedGraphicObject
+from pyg.objects.batching import bake
 from pyg.utils import Color
 
 
 #: Generic variable indicating a subclass of the `Camera` class.
 C = TypeVar("C", bound=Camera)
 
+#: Timeouts (in seconds) up to which `Window.wait_events_timeout()` polls the
+#: events in a loop instead of sleeping, since some platforms can't sleep for
+#: such short periods (they round the timeout up to their timer's tick).
+_SPIN_TIMEOUT = 2e-3
+
+#: Members of the `Key` and `KeyboardAction` enums indexed by their values.
+#: Looking them up is cheaper than calling the enums on every input event.
+_KEYS = {key.value: key for key in Key}
+_KEYBOARD_ACTIONS = {action.value: action for action in KeyboardAction}
+
 
 class Window(Generic[C]):
     """ Represents a window in the application.
@@ -29,15 +45,58 @@ class Window(Generic[C]):
     window per process).
     """
 
+    __slots__ = (
+        "_name",
+        "_glfw_window",
+        "_size",
+        "_camera",
+        "_clear_mask",
+        "_clear_color",
+        "_drawer",
+        "_batch",
+        "_batch_cell_size",
+        "_baked",
+        "_draw_queue",
+        "_frame_cap",
+        "_last_update",
+        "_needs_redraw",
+        "_bench_mode",
+        # The drawer's GL state and shader programs are kept per window, in
+        # weak-keyed dictionaries.
+        "__weakref__",
+    )
+
+    #: The window whose OpenGL context was last made current.
+    _current: ClassVar[Optional[Window]] = None
+
     def __init__(self,
                  width: int,
                  height: int,
                  name: str = "My app",
                  use_textures: bool = False,
                  depth_testing: bool = False,
-                 camera: Optional[C] = None) -> None:
+                 camera: Optional[C] = None,
+                 *,
+                 vsync: bool = True) -> None:
         self._name = name
         self._glfw_window = glfw.create_window(width, height, name, None, None)
+
+        # The window's callbacks only hold a weak reference to it, so GLFW
+        # doesn't keep it alive.
+        window_ref = weakref.ref(self)
+
+        # The window's size is read by the camera on every frame, so it's
+        # cached and only queried again after the window is resized.
+        self._size: Optional[tuple[int, int]] = None
+
+        def win_size_callback(_, new_width: int, new_height: int) -> None:
+            # pylint: disable=W0212
+            window = window_ref()
+            if window is not None:
+                window._size = (new_width, new_height)
+
+        glfw.set_window_size_callback(self._glfw_window, win_size_callback)
+
         self._camera = camera or SimpleCamera(window=self)
 
         # Tell OpenGL the initial size of the window.
@@ -47,12 +106,26 @@ class Window(Generic[C]):
         if use_textures:
             gl.glEnable(gl.GL_TEXTURE_2D)
 
+        # The depth buffer only needs to be cleared if depth testing is
+        # enabled. The clear color is only sent to OpenGL when it changes.
+        self._clear_mask = gl.GL_COLOR_BUFFER_BIT
+        if depth_testing:
+            self._clear_mask |= gl.GL_DEPTH_BUFFER_BIT
+        self._clear_color: Color = (0, 0, 0, 0)
+
         # Set up a callback to update OpenGL's viewport when the window is
-        # resized.
+        # resized. The buffers are swapped directly, since waiting for the
+        # frame cap (see `update()`) would only make resizing stutter.
         def win_resize_callback(_, new_width: int, new_height: int) -> None:
-            gl.glViewport(0, 0, new_width, new_height)
-            self.clear(tuple(gl.glGetFloatv(gl.GL_COLOR_CLEAR_VALUE)))
-            self.update()
+            # pylint: disable=W0212
+            window = window_ref()
+            if window is None:
+                return
+
+            with window:
+                gl.glViewport(0, 0, new_width, new_height)
+                gl.glClear(window._clear_mask)
+            glfw.swap_buffers(window._glfw_window)
 
         glfw.set_framebuffer_size_callback(self._glfw_window,
                                            win_resize_callback)
@@ -60,18 +133,38 @@ class Window(Generic[C]):
         # Instantiate a drawer.
         self._drawer = Drawer(self, use_textures)
 
+        # Static objects merged by `draw_batch()` (`None` until they are
+        # merged), the cell size used to merge them and the objects created by
+        # the merge.
+        self._batch: Optional[list[GraphicObject]] = None
+        self._batch_cell_size: Optional[float] = None
+        self._baked: list[GraphicObject] = []
+
+        # Objects waiting to be drawn by `flush()`.
+        self._draw_queue: list[GraphicObject] = []
+
         # Enable depth testing.
         if depth_testing:
             with self:
                 gl.glEnable(gl.GL_DEPTH_TEST)
 
+        # Frame pacing.
+        self._frame_cap: Optional[float] = None
+        self._last_update = time.perf_counter()
+        self._needs_redraw = False
+        self._bench_mode = False
+        self.set_vsync(vsync)
+
     @property
     def size(self) -> tuple[int, int]:
-        return glfw.get_window_size(self._glfw_window)
+        if self._size is None:
+            self._size = glfw.get_window_size(self._glfw_window)
+        return self._size
 
     @size.setter
     def size(self, new_size: tuple[int, int]) -> None:
         glfw.set_window_size(self._glfw_window, *new_size)
+        self._size = None
 
     @property
     def name(self) -> str:
@@ -90,9 +183,97 @@ class Window(Generic[C]):
     def camera(self) -> C:
         return self._camera
 
+    def draw_batch(self,
+                   objects: Iterable[GraphicObject],
+                   dynamic: Iterable[GraphicObject] = (),
+                   cell_size: Optional[float] = 2.0) -> None:
+        """ Draws many objects, merging the static ones into batches.
+
+        The first time this method is called, the static objects sharing the
+        same texture and close to each other (in the same cell of a grid) are
+        merged into a single object with pre-transformed vertices (see
+        :func:`pyg.objects.batching.bake`). The merged objects are cached and
+        reused by the following calls, which only go through `objects` again
+        if the cell size changes. After static objects are added, removed or
+        changed (e.g. moved), :meth:`rebake` must be called, so they are merged
+        again by the next call.
+
+        Only the objects within the camera's view are drawn. The culling (see
+        :meth:`pyg.cameras.Camera.cull`) happens after the merge, so each
+        merged object is either drawn or skipped as a whole, based on a
+        bounding box enclosing all of its objects. Larger cells mean fewer
+        draw calls, but fewer objects are skipped; without cells, the merged
+        objects usually span the whole scene and are never culled.
+
+        The static objects are drawn in the order in which they are given,
+        except that the objects of a merged object are all drawn in the place
+        of the first of them. The dynamic objects are drawn after them.
+
+        Args:
+            objects: The objects to be drawn. Objects that are also in
+                `dynamic` are not treated as static.
+            dynamic: Objects that change between frames. They are drawn
+                individually and never merged.
+            cell_size: Length of the edges of the grid's cells, in world
+                units. If `None`, the static objects are merged regardless of
+                their positions.
+        """
+        dynamic = list(dynamic)
+        if self._batch is None or cell_size != self._batch_cell_size:
+            self.rebake()
+            dynamic_ids = {id(obj) for obj in dynamic}
+            static = [obj for obj in objects if id(obj) not in dynamic_ids]
+            self._batch = bake(static, cell_size)
+            self._batch_cell_size = cell_size
+
+            # Keep the objects created by the merge, whose buffers must be
+            # released when the static objects are merged again.
+            static_ids = {id(obj) for obj in static}
+            self._baked = [obj for obj in self._batch
+                           if id(obj) not in static_ids]
+
+        self._drawer.draw_many(self._camera.cull(self._batch + dynamic))
+
+    def rebake(self) -> None:
+        """ Discards the static objects merged by :meth:`draw_batch`, so they
+        are merged again the next time it's called.
+
+        The merged objects don't reflect changes made to the original objects,
+        so this must be called after static objects are added, removed or
+        changed.
+        """
+        with self:
+            for obj in self._baked:
+                if isinstance(obj, TexturizedGraphicObject):
+                    obj.texture.release_coordinates()
+        self._baked = []
+        self._batch = None
+
+    def queue(self, obj: GraphicObject) -> None:
+        """ Queues an object to be drawn by the next call to :meth:`flush`. """
+        self._draw_queue.append(obj)
+
+    def flush(self) -> None:
+        """ Draws all the queued objects, in the order in which they were
+        queued, and empties the queue.
+
+        Drawing the objects together is cheaper than drawing each of them
+        separately, since the state they share is only set up once.
+        """
+        if self._draw_queue:
+            self._drawer.draw_many(self._draw_queue)
+            self._draw_queue = []
+
     def __enter__(self) -> Window:
-        """ Makes this window the current OpenGL context. """
-        glfw.make_context_current(self._glfw_window)
+        """ Makes this window the current OpenGL context.
+
+        The context is only switched if another window's context is current,
+        so entering the window repeatedly (once per draw) is cheap. Windows
+        are assumed to be used from a single thread.
+        """
+        if Window._current is not self:
+            glfw.make_context_current(self._glfw_window)
+            Window._current = self
         return self
 
     def __exit__(self,
@@ -108,11 +289,113 @@ class Window(Generic[C]):
         """ Updates the window.
 
         When drawing on the window inside a loop, this should be called in every
-        iteration. When the window is resized, this method is automatically
-        called.
+        iteration. When the window is resized, it's cleared and its buffers
+        are swapped automatically.
+
+        If V-Sync is enabled (see :meth:`set_vsync`), this method waits for the
+        display's next refresh. If a frame cap is set (see
+        :meth:`set_frame_cap`), it also waits until the minimum time between
+        frames has elapsed since the previous call.
+
+        In benchmark mode (see :meth:`set_bench_mode`), this method only
+        flushes the pending OpenGL commands.
         """
+        if self._bench_mode:
+            with self:
+                gl.glFlush()
+            return
+
         glfw.swap_buffers(self._glfw_window)
 
+        if self._frame_cap is not None:
+            # Sleep for most of the remaining time, then spin for the rest,
+            # since the OS' sleep granularity is too coarse for exact pacing.
+            target = self._last_update + 1 / self._frame_cap
+            remaining = target - time.perf_counter()
+            if remaining > 1e-3:
+                time.sleep(remaining - 1e-3)
+            while time.perf_counter() < target:
+                pass
+        self._last_update = time.perf_counter()
+
+    def run(self,
+            on_frame: Callable[[Window], None],
+            lazy: bool = False) -> None:
+        """ Runs the window's main loop until the window is instructed to close.
+
+        Each frame is drawn by `on_frame` and then shown by :meth:`update`.
+
+        Args:
+            on_frame: Function called, with the window as argument, to draw
+                each frame (including clearing the window, if needed).
+            lazy: If `False` (appropriate for games), frames are drawn
+                continuously and the events are polled between them. If `True`
+                (appropriate for editors and tools), the loop sleeps until an
+                event is received (or :meth:`request_redraw` is called) and only
+                then draws a new frame, so no CPU time is spent while the app
+                is idle.
+        """
+        self._needs_redraw = True
+        while not self.should_close():
+            if lazy and not self._needs_redraw:
+                self.wait_events()
+            else:
+                self.poll_events()
+
+            self._needs_redraw = False
+            on_frame(self)
+            self.update()
+
+    def request_redraw(self) -> None:
+        """ Requests :meth:`run` to draw a new frame, waking it up if it's
+        waiting for events.
+        """
+        self._needs_redraw = True
+        glfw.post_empty_event()
+
+    def set_vsync(self, enabled: bool) -> None:
+        """ Enables or disables vertical synchronization (V-Sync).
+
+        When enabled (the default), :meth:`update` waits for the display's
+        vertical blank before returning, which limits the frame rate to the
+        display's refresh rate without tearing.
+        """
+        with self:
+            glfw.swap_interval(1 if enabled else 0)
+
+    def set_bench_mode(self, enabled: bool) -> None:
+        """ Enables or disables the benchmark mode.
+
+        In benchmark mode, :meth:`update` doesn't swap the window's buffers
+        (so nothing new is shown and V-Sync has no effect) nor waits for the
+        frame cap, and the methods that wait for events only poll them. This
+        exposes the maximum throughput of the drawing code, which is useful
+        when measuring it or when the frames are never shown.
+        """
+        self._bench_mode = enabled
+
+    @contextlib.contextmanager
+    def benchmark(self) -> Iterator[Window]:
+        """ Context manager that enables the benchmark mode (see
+        :meth:`set_bench_mode`) within its block.
+        """
+        previous = self._bench_mode
+        self.set_bench_mode(True)
+        try:
+            yield self
+        finally:
+            self.set_bench_mode(previous)
+
+    def set_frame_cap(self, fps: Optional[float]) -> None:
+        """ Sets the maximum number of frames per second.
+
+        Args:
+            fps: The maximum frame rate, enforced by :meth:`update`. If `None`,
+                the frame rate isn't capped (other than by V-Sync).
+        """
+        assert fps is None or fps > 0
+        self._frame_cap = fps
+
     def show(self) -> None:
         """ Shows the window. """
         glfw.show_window(self._glfw_window)
@@ -121,17 +404,24 @@ class Window(Generic[C]):
         """ Destroys the window. """
         glfw.destroy_window(self._glfw_window)
         self._glfw_window = None
+        if Window._current is self:
+            Window._current = None
 
     def should_close(self) -> bool:
         """ Returns `True` if the window has been instructed to close. """
         return glfw.window_should_close(self._glfw_window)
 
     def clear(self,
-              color: Color = (0, 0, 0, 1)) -> None:
+              color: Color | np.ndarray = (0, 0, 0, 1)) -> None:
         """ Clears the screen using the given color. """
+        # Colors are compared as tuples of floats, since comparing NumPy
+        # arrays doesn't return a single boolean.
+        r, g, b, a = map(float, color)
         with self:
-            gl.glClearColor(*color)
-            gl.glClear(gl.GL_COLOR_BUFFER_BIT | gl.GL_DEPTH_BUFFER_BIT)
+            if (r, g, b, a) != self._clear_color:
+                gl.glClearColor(r, g, b, a)
+                self._clear_color = (r, g, b, a)
+            gl.glClear(self._clear_mask)
 
     def poll_events(self) -> None:
         """ Processes the events that are already in the event queue, then
@@ -154,7 +444,10 @@ class Window(Generic[C]):
         example, editing tools.
         """
         with self:
-            glfw.wait_events()
+            if self._bench_mode:
+                glfw.poll_events()
+            else:
+                glfw.wait_events()
 
     def wait_events_timeout(self, timeout: float) -> None:
         """ Puts the current thread to sleep until at least one event has been
@@ -164,11 +457,25 @@ class Window(Generic[C]):
         If you want to wait for events but have UI elements or other tasks that
         need periodic updates, this method lets you specify a timeout.
 
+        Very short timeouts (up to 2 ms) are waited for by polling the events
+        in a loop, which is more precise than sleeping but keeps the CPU busy.
+
         Args:
             timeout: The maximum waiting time, in seconds.
         """
         with self:
-            glfw.wait_events_timeout(timeout)
+            if self._bench_mode:
+                glfw.poll_events()
+                return
+
+            if timeout > _SPIN_TIMEOUT:
+                glfw.wait_events_timeout(timeout)
+                return
+
+            end = time.perf_counter() + timeout
+            glfw.poll_events()
+            while time.perf_counter() < end:
+                glfw.poll_events()
 
     def post_empty_event(self) -> None:
         """ Posts an empty event to wake up a thread put to sleep by
@@ -190,7 +497,7 @@ class Window(Generic[C]):
                              scancode: int,
                              action: int,
                              mods: int) -> None:
-            callback(Key(key), KeyboardAction(action))
+            callback(_KEYS[key], _KEYBOARD_ACTIONS[action])
 
         glfw.set_key_callback(self._glfw_window, callback_wrapper)
 
@@ -198,7 +505,7 @@ class Window(Generic[C]):
         """ Returns the last known state (pressed or released) of the given
         keyboard key in this window.
         """
-        return KeyboardAction(glfw.get_key(self._glfw_window, key.value))
+        return _KEYBOARD_ACTIONS[glfw.get_key(self._glfw_window, key.value)]
 
     def set_cursor_pos_callback(
         self,
@@ -230,3 +537,16 @@ class Window(Generic[C]):
             callback(y_pos)
 
         glfw.set_scroll_callback(self._glfw_window, callback_wrapper)
+
+    def set_refresh_callback(self, callback: Callable[[], None]) -> None:
+        """ Set up a callback to be fired when the contents of the window need
+        to be redrawn (for example, after it has been resized or uncovered).
+
+        Applications that only redraw the window when their scene changes
+        should use this callback to know when to redraw it anyway.
+        """
+        # pylint: disable=W0613
+        def callback_wrapper(glfw_window: Any) -> None:
+            callback()
+
+        glfw.set_window_refresh_callback(self._glfw_window, callback_wrapper)
@@ -15,12 +15,14 @@ setup(
     keywords="graphics, opengl, draw",
     python_requires=">=3.9, <4",
     install_requires=[
-        "numpy==1.22.3",
-        "PyGLM==2.5.7",
-        "PyOpenGL==3.1.6",
-        "PyOpenGL-accelerate==3.1.5",
-        "glfw==2.5.1",
-        "Pillow==9.1.1",
+        "numpy>=1.22.3,<3",
+        "PyGLM>=2.5.7,<3",
+        # PyOpenGL only uses an accelerate package that is at least as new as
+        # itself, so both must be kept on the same release line.
+        "PyOpenGL>=3.1.6,<3.2",
+        "PyOpenGL-accelerate>=3.1.6,<3.2",
+        "glfw>=2.5.1,<3",
+        "Pillow>=9.1.1,<13",
     ],
     extras_require={
         "dev": [